@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 from .blueprint import Line, lines_to_world
-from .contours import FTContour, freetype_outline_to_contours
+from .contours import FTContour, freetype_outline_to_contours, freetype_outlines_to_contours_batch
 from .fill import fill_polygon_with_rectangles, intersect_spans, iter_line_segments_from_intersection
 from .geometry import (
     Point,
     add,
     norm,
     polygon_is_ccw,
+    polygon_signed_area,
     rotate90_ccw,
     rotate90_cw,
     scale,
@@ -17,12 +18,16 @@ from .geometry import (
     unit_vector,
 )
 from .glyph import GlyphOutline, get_glyph_outline, outline_to_polygon
-from .pipeline import build_rectangles_for_glyph
+from .pipeline import build_rectangles_for_glyph, build_rectangles_for_glyphs, build_rectangles_for_string
 from .rectangles import (
+    corners_to_rectangles,
     extend_backward,
     extend_forward,
+    extend_rectangle_corners,
     extend_rectangles,
+    rectangle_corners_along_polylines,
     rectangles_along_polyline,
+    rectangles_along_polylines,
     remove_narrow_areas,
 )
 
@@ -33,11 +38,16 @@ __all__ = [
     "Point",
     "add",
     "build_rectangles_for_glyph",
+    "build_rectangles_for_glyphs",
+    "build_rectangles_for_string",
+    "corners_to_rectangles",
     "extend_backward",
     "extend_forward",
+    "extend_rectangle_corners",
     "extend_rectangles",
     "fill_polygon_with_rectangles",
     "freetype_outline_to_contours",
+    "freetype_outlines_to_contours_batch",
     "get_glyph_outline",
     "intersect_spans",
     "iter_line_segments_from_intersection",
@@ -45,7 +55,10 @@ __all__ = [
     "norm",
     "outline_to_polygon",
     "polygon_is_ccw",
+    "polygon_signed_area",
+    "rectangle_corners_along_polylines",
     "rectangles_along_polyline",
+    "rectangles_along_polylines",
     "remove_narrow_areas",
     "rotate90_ccw",
     "rotate90_cw",
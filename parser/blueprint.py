@@ -61,21 +61,23 @@ def lines_to_world(lines: np.ndarray) -> list[Line]:
     cos_half = np.cos(half_angles)
 
     zero_mask = lengths == 0.0
-    z_component = sin_half.copy()
-    w_component = cos_half.copy()
-    z_component[zero_mask] = 0.0
-    w_component[zero_mask] = 1.0
-
-    blueprint_lines: list[Line] = []
-    for index in range(lines.shape[0]):
-        blueprint_lines.append(
-            Line(
-                length=float(lengths[index]),
-                rotation={"x": 0.0, "y": 0.0, "z": float(z_component[index]), "w": float(w_component[index])},
-                translation={"x": float(starts[index, 0]), "y": float(starts[index, 1]), "z": 0.0},
-            ),
+    z_component = np.where(zero_mask, 0.0, sin_half)
+    w_component = np.where(zero_mask, 1.0, cos_half)
+
+    return [
+        Line(
+            length=length,
+            rotation={"x": 0.0, "y": 0.0, "z": z, "w": w},
+            translation={"x": x, "y": y, "z": 0.0},
         )
-    return blueprint_lines
+        for length, z, w, x, y in zip(
+            lengths.tolist(),
+            z_component.tolist(),
+            w_component.tolist(),
+            starts[:, 0].tolist(),
+            starts[:, 1].tolist(),
+        )
+    ]
 
 
 __all__ = ["Line", "lines_to_world"]
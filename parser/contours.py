@@ -2,31 +2,85 @@
 
 from __future__ import annotations
 
+import threading
+import weakref
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import freetype
+import numpy as np
 from fontTools.pens.recordingPen import DecomposingRecordingPen
 from fontTools.ttLib import TTFont
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from fontTools.ttLib.ttGlyphSet import _TTGlyphSet
+
     from .geometry import Point
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class FTContour:
     """Representation of a single glyph contour.
 
+    Contours returned by the extractors in this module are shared between calls through a cache, so they are
+    immutable and their point arrays are read-only.
+
     Parameters
     ----------
-    points : list of Point
-        Control points that define the contour in font units.
-    on_curve : list of bool
+    points : ndarray, shape (N, 2)
+        Control points that define the contour in font units, stored as float64.
+    on_curve : tuple of bool
         Flags indicating whether each point lies on the contour curve.
     """
 
-    points: list[Point]
-    on_curve: list[bool]
+    points: np.ndarray
+    on_curve: tuple[bool, ...]
+
+    def _key(self) -> tuple[bytes, tuple[bool, ...]]:
+        # The generated ``__eq__`` would compare the point arrays elementwise and the generated ``__hash__`` cannot
+        # hash them at all, so both are defined on the raw float64 bytes instead.
+        points = np.ascontiguousarray(self.points, dtype=np.float64).reshape(-1, 2)
+        return points.tobytes(), tuple(self.on_curve)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FTContour):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+
+# Extraction results keyed by ``(id(face or font), char, pixel_height)``. Entries are evicted once the owning
+# face or font is garbage-collected, so a recycled ``id`` never serves stale contours.
+_FREETYPE_CACHE: dict[tuple[int, str, int], tuple[tuple[FTContour, ...], int]] = {}
+_FONTTOOLS_CACHE: dict[tuple[int, str, int], tuple[tuple[FTContour, ...], tuple[tuple[int, ...], ...]]] = {}
+# Character map and units-per-em keyed by ``id(font)``, evicted together with the contour entries. The glyph set is
+# not cached because it references its font and would keep it alive.
+_FONTTOOLS_LOOKUP: dict[int, tuple[dict[int, str], int]] = {}
+_TRACKED_OWNERS: set[int] = set()
+# Faces and lazily loaded fonts decompile glyph data in place, so extraction is serialized across threads.
+_EXTRACTION_LOCK = threading.RLock()
+
+
+def _track_owner(owner: object) -> int:
+    """Return the cache key prefix for ``owner`` and register its eviction on garbage collection."""
+    owner_id = id(owner)
+    if owner_id not in _TRACKED_OWNERS:
+        _TRACKED_OWNERS.add(owner_id)
+        weakref.finalize(owner, _evict_owner, owner_id)
+    return owner_id
+
+
+def _evict_owner(owner_id: int) -> None:
+    with _EXTRACTION_LOCK:
+        _TRACKED_OWNERS.discard(owner_id)
+        _FONTTOOLS_LOOKUP.pop(owner_id, None)
+        for cache in (_FREETYPE_CACHE, _FONTTOOLS_CACHE):
+            for key in [key for key in cache if key[0] == owner_id]:
+                del cache[key]
 
 
 def freetype_outline_to_contours(
@@ -48,34 +102,106 @@ def freetype_outline_to_contours(
     Returns
     -------
     list of FTContour
-        The glyph contours in drawing order.
+        The glyph contours in drawing order. Results are cached per face, character and pixel height, so the
+        contours are shared with other callers.
     int
         Outline flag bits reported by FreeType.
     """
-    face.set_pixel_sizes(0, pixel_height)
+    with _EXTRACTION_LOCK:
+        key = (_track_owner(face), char, pixel_height)
+        cached = _FREETYPE_CACHE.get(key)
+        if cached is None:
+            face.set_pixel_sizes(0, pixel_height)
+            cached = _FREETYPE_CACHE[key] = _load_freetype_contours(face, char)
+    contours, flags = cached
+    return list(contours), flags
+
+
+def freetype_outlines_to_contours_batch(
+    face: freetype.Face,
+    chars: Iterable[str],
+    pixel_height: int,
+) -> list[tuple[list[FTContour], int]]:
+    """Convert the FreeType outlines of several characters into contour objects.
+
+    The face is sized at most once for the whole batch instead of once per character, and characters already
+    extracted at ``pixel_height`` are served from the cache. FreeType faces are not thread-safe, so the glyphs
+    are loaded sequentially.
+
+    Parameters
+    ----------
+    face : freetype.Face
+        FreeType face containing the glyphs.
+    chars : iterable of str
+        Characters whose glyphs should be extracted.
+    pixel_height : int
+        Requested pixel height for every glyph.
+
+    Returns
+    -------
+    list of tuple
+        ``(contours, flags)`` pairs as returned by :func:`freetype_outline_to_contours`, in input order.
+    """
+    results: list[tuple[list[FTContour], int]] = []
+    with _EXTRACTION_LOCK:
+        owner_id = _track_owner(face)
+        sized = False
+        for char in chars:
+            key = (owner_id, char, pixel_height)
+            cached = _FREETYPE_CACHE.get(key)
+            if cached is None:
+                if not sized:
+                    face.set_pixel_sizes(0, pixel_height)
+                    sized = True
+                cached = _FREETYPE_CACHE[key] = _load_freetype_contours(face, char)
+            contours, flags = cached
+            results.append((list(contours), flags))
+    return results
+
+
+def _load_freetype_contours(face: freetype.Face, char: str) -> tuple[tuple[FTContour, ...], int]:
     face.load_char(char, freetype.FT_LOAD_NO_BITMAP)
     outline: freetype.Outline = face.glyph.outline
 
-    scale = 1.0 / 64.0
+    if not outline.contours:
+        return (), outline.flags
+
+    scaled_points = np.asarray(outline.points, dtype=np.float64).reshape(-1, 2) * (1.0 / 64.0)
+    scaled_points.flags.writeable = False
+    on_curve_flags = tuple((np.asarray(outline.tags, dtype=np.uint8) & 1).astype(bool).tolist())
+
     contours: list[FTContour] = []
     start_index = 0
 
     for end_index in outline.contours:
-        points = outline.points[start_index : end_index + 1]
-        tags = outline.tags[start_index : end_index + 1]
-        scaled_points = [(float(x) * scale, float(y) * scale) for (x, y) in points]
-        on_curve = [bool(tag & 1) for tag in tags]
-        contours.append(FTContour(points=scaled_points, on_curve=on_curve))
+        points = scaled_points[start_index : end_index + 1]
+        on_curve = on_curve_flags[start_index : end_index + 1]
+        contours.append(FTContour(points=points, on_curve=on_curve))
         start_index = end_index + 1
 
-    return contours, outline.flags
+    return tuple(contours), outline.flags
+
+
+def _fonttools_lookup(font: TTFont) -> tuple[dict[int, str], _TTGlyphSet, int]:
+    """Return the character map, glyph set and units-per-em of ``font``.
+
+    The character map and units-per-em are cached per font object, so repeated glyph extractions skip the table
+    lookups. The cache holds no reference to the font and drops its entry when the font is garbage-collected.
+    """
+    with _EXTRACTION_LOCK:
+        owner_id = _track_owner(font)
+        cached = _FONTTOOLS_LOOKUP.get(owner_id)
+        if cached is None:
+            cached = _FONTTOOLS_LOOKUP[owner_id] = (font.getBestCmap(), font["head"].unitsPerEm)
+        cmap, units_per_em = cached
+        return cmap, font.getGlyphSet(), units_per_em
 
 
 def fonttools_outline_to_contours(
     font: TTFont,
     char: str,
     pixel_height: int,
-) -> tuple[list[FTContour], list[list[int]]]:
+) -> tuple[list[FTContour], list[tuple[int, ...]]]:
     """Convert a FontTools glyph into contour objects and point tags.
 
     Parameters
@@ -91,32 +217,48 @@ def fonttools_outline_to_contours(
     -------
     list of FTContour
         Extracted glyph contours scaled to ``pixel_height``.
-    list of list of int
+    list of tuple of int
         Point tags compatible with :func:`parser.flattening.flatten_contour`.
+
+    Notes
+    -----
+    Results are cached per font, character and pixel height, so the contours are shared with other callers.
     """
     if not char:
         msg = "Character must be a single codepoint."
         raise ValueError(msg)
 
-    cmap = font.getBestCmap()
+    with _EXTRACTION_LOCK:
+        key = (_track_owner(font), char, pixel_height)
+        cached = _FONTTOOLS_CACHE.get(key)
+        if cached is None:
+            cached = _FONTTOOLS_CACHE[key] = _load_fonttools_contours(font, char, pixel_height)
+    contours, tags_per_contour = cached
+    return list(contours), list(tags_per_contour)
+
+
+def _load_fonttools_contours(
+    font: TTFont,
+    char: str,
+    pixel_height: int,
+) -> tuple[tuple[FTContour, ...], tuple[tuple[int, ...], ...]]:
+    cmap, glyph_set, units_per_em = _fonttools_lookup(font)
     glyph_name = cmap.get(ord(char))
     if glyph_name is None:
         msg = f"Glyph for character {char!r} not found in font."
         raise ValueError(msg)
 
-    units_per_em = font["head"].unitsPerEm
     if units_per_em <= 0:
         msg = "Font reports non-positive units per em."
         raise ValueError(msg)
 
     scale = float(pixel_height) / float(units_per_em)
 
-    glyph_set = font.getGlyphSet()
     pen = DecomposingRecordingPen(glyph_set)
     glyph_set[glyph_name].draw(pen)
 
     contours: list[FTContour] = []
-    tags_per_contour: list[list[int]] = []
+    tags_per_contour: list[tuple[int, ...]] = []
 
     current_points: list[Point] = []
     current_tags: list[int] = []
@@ -125,8 +267,10 @@ def fonttools_outline_to_contours(
     def flush_contour() -> None:
         nonlocal current_points, current_tags, current_on_curve
         if current_points:
-            contours.append(FTContour(points=current_points, on_curve=current_on_curve))
-            tags_per_contour.append(current_tags)
+            points = np.asarray(current_points, dtype=np.float64).reshape(-1, 2)
+            points.flags.writeable = False
+            contours.append(FTContour(points=points, on_curve=tuple(current_on_curve)))
+            tags_per_contour.append(tuple(current_tags))
             current_points = []
             current_tags = []
             current_on_curve = []
@@ -167,11 +311,12 @@ def fonttools_outline_to_contours(
 
     flush_contour()
 
-    return contours, tags_per_contour
+    return tuple(contours), tuple(tags_per_contour)
 
 
 __all__ = [
     "FTContour",
     "fonttools_outline_to_contours",
     "freetype_outline_to_contours",
+    "freetype_outlines_to_contours_batch",
 ]
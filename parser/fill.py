@@ -5,6 +5,8 @@ from __future__ import annotations
 from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
+import numpy as np
+import shapely
 from shapely.geometry import GeometryCollection, LineString, MultiLineString, Polygon
 
 if TYPE_CHECKING:
@@ -25,19 +27,19 @@ def iter_line_segments_from_intersection(geometry) -> list[tuple[float, float]]:
         Sorted list of coordinate intervals where the line penetrates the polygon.
     """
     spans: list[tuple[float, float]] = []
-    if isinstance(geometry, LineString):
-        coordinates = list(geometry.coords)
-        xs, ys = zip(*coordinates)
-        if abs(xs[0] - xs[-1]) < 1e-12:
-            spans.append((min(ys), max(ys)))
-        else:
-            spans.append((min(xs), max(xs)))
-    elif isinstance(geometry, MultiLineString):
-        for line in geometry.geoms:
-            spans.extend(iter_line_segments_from_intersection(line))
-    elif isinstance(geometry, GeometryCollection):
-        for element in geometry.geoms:
-            spans.extend(iter_line_segments_from_intersection(element))
+    stack = [geometry]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, LineString):
+            coordinates = shapely.get_coordinates(current)
+            if coordinates.shape[0] == 0:
+                continue
+            # Vertical lines are measured along y, everything else along x.
+            axis = 1 if abs(coordinates[0, 0] - coordinates[-1, 0]) < 1e-12 else 0
+            values = coordinates[:, axis]
+            spans.append((float(values.min()), float(values.max())))
+        elif isinstance(current, (MultiLineString, GeometryCollection)):
+            stack.extend(current.geoms)
 
     spans = [span for span in spans if (span[1] - span[0]) > 1e-9]
     spans.sort()
@@ -65,19 +67,129 @@ def intersect_spans(
     list of tuple of float
         Overlapping intervals from the two input sequences.
     """
-    index_a = 0
-    index_b = 0
-    overlaps: list[tuple[float, float]] = []
-    while index_a < len(first) and index_b < len(second):
-        start = max(first[index_a][0], second[index_b][0])
-        end = min(first[index_a][1], second[index_b][1])
-        if end - start > tolerance:
-            overlaps.append((start, end))
-        if first[index_a][1] <= second[index_b][1] + tolerance:
-            index_a += 1
-        else:
-            index_b += 1
-    return overlaps
+    if not len(first) or not len(second):
+        return []
+
+    spans_a = np.asarray(first, dtype=np.float64).reshape(-1, 2)
+    spans_b = np.asarray(second, dtype=np.float64).reshape(-1, 2)
+
+    # Both inputs are ordered and disjoint, so the spans of ``second`` that can overlap a span of ``first`` form a
+    # contiguous block: those ending after it starts and starting before it ends.
+    lower = np.searchsorted(spans_b[:, 1], spans_a[:, 0], side="right")
+    upper = np.searchsorted(spans_b[:, 0], spans_a[:, 1], side="left")
+    counts = np.maximum(upper - lower, 0)
+    total = int(counts.sum())
+    if total == 0:
+        return []
+
+    index_a = np.repeat(np.arange(spans_a.shape[0]), counts)
+    block_offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    index_b = np.repeat(lower, counts) + np.arange(total) - block_offsets
+
+    starts = np.maximum(spans_a[index_a, 0], spans_b[index_b, 0])
+    ends = np.minimum(spans_a[index_a, 1], spans_b[index_b, 1])
+    keep = (ends - starts) > tolerance
+    return list(zip(starts[keep].tolist(), ends[keep].tolist()))
+
+
+def _scan_edges(polygon) -> np.ndarray:
+    """Collect the non-horizontal ring edges of a polygonal geometry for scanline queries.
+
+    Parameters
+    ----------
+    polygon : Polygon or MultiPolygon
+        Geometry whose exterior and interior rings should be scanned.
+
+    Returns
+    -------
+    ndarray, shape (E, 4)
+        Edges as ``(x_low, y_low, x_high, y_high)`` rows oriented upwards and sorted by ``y_low``.
+    """
+    rings = shapely.get_rings(shapely.get_parts(polygon))
+    coords, ring_index = shapely.get_coordinates(rings, return_index=True)
+    same_ring = ring_index[:-1] == ring_index[1:]
+    edges = np.concatenate([coords[:-1][same_ring], coords[1:][same_ring]], axis=1)
+    edges = edges[edges[:, 1] != edges[:, 3]]
+
+    downward = edges[:, 1] > edges[:, 3]
+    edges[downward] = edges[downward][:, [2, 3, 0, 1]]
+    return edges[np.argsort(edges[:, 1], kind="stable")]
+
+
+def _crossing_spans(edges: np.ndarray, slopes: np.ndarray, y: float) -> list[tuple[float, float]]:
+    """Pair the sorted crossings of the edges active at height ``y`` into even-odd interior spans."""
+    # Treating each edge as the half-open range [y_low, y_high) counts shared vertices exactly once.
+    active = (edges[:, 1] <= y) & (edges[:, 3] > y)
+    crossings = edges[active, 0] + (y - edges[active, 1]) * slopes[active]
+    crossings.sort()
+    spans = crossings.reshape(-1, 2)
+    spans = spans[(spans[:, 1] - spans[:, 0]) > 1e-9]
+    return list(map(tuple, spans.tolist()))
+
+
+def _strip_spans(
+    edges: np.ndarray,
+    y_bottom: float,
+    y_top: float,
+    tolerance: float,
+) -> list[tuple[float, float]]:
+    """Find the x-intervals where the polygon spans both edges of a horizontal strip.
+
+    Parameters
+    ----------
+    edges : ndarray, shape (E, 4)
+        Edge table produced by :func:`_scan_edges`.
+    y_bottom, y_top : float
+        Heights of the lower and upper strip scanlines.
+    tolerance : float
+        Numerical tolerance forwarded to :func:`intersect_spans`.
+
+    Returns
+    -------
+    list of tuple of float
+        Ordered intervals inside the polygon on both scanlines.
+    """
+    # Edges are sorted by their lower endpoint, so those starting below the strip top form a prefix; of those,
+    # only edges reaching past the strip bottom can cross either scanline.
+    candidates = edges[: np.searchsorted(edges[:, 1], y_top, side="right")]
+    candidates = candidates[candidates[:, 3] > y_bottom]
+    slopes = (candidates[:, 2] - candidates[:, 0]) / (candidates[:, 3] - candidates[:, 1])
+    spans_bottom = _crossing_spans(candidates, slopes, y_bottom)
+    spans_top = _crossing_spans(candidates, slopes, y_top)
+    return intersect_spans(spans_bottom, spans_top, tolerance=tolerance)
+
+
+def _strip_crossing_ranges(
+    edges: np.ndarray,
+    vertex_ys: np.ndarray,
+    y_bottom: float,
+    y_top: float,
+) -> np.ndarray | None:
+    """Return the x-extent of every edge crossing a vertex-free horizontal strip.
+
+    Parameters
+    ----------
+    edges : ndarray, shape (E, 4)
+        Edge table produced by :func:`_scan_edges`.
+    vertex_ys : ndarray, shape (V,)
+        Sorted y coordinates of all polygon vertices.
+    y_bottom, y_top : float
+        Extent of the strip.
+
+    Returns
+    -------
+    ndarray, shape (K, 2) or None
+        ``(x_min, x_max)`` of each crossing edge inside the strip, or ``None`` when a polygon vertex lies within
+        ``[y_bottom, y_top]`` and the edges cannot be treated as straight crossings.
+    """
+    if np.searchsorted(vertex_ys, y_bottom, side="left") != np.searchsorted(vertex_ys, y_top, side="right"):
+        return None
+    # Without vertices in the strip every edge reaching it spans it completely.
+    crossing = edges[(edges[:, 1] < y_bottom) & (edges[:, 3] > y_top)]
+    slopes = (crossing[:, 2] - crossing[:, 0]) / (crossing[:, 3] - crossing[:, 1])
+    x_bottom = crossing[:, 0] + (y_bottom - crossing[:, 1]) * slopes
+    x_top = crossing[:, 0] + (y_top - crossing[:, 1]) * slopes
+    return np.stack([np.minimum(x_bottom, x_top), np.maximum(x_bottom, x_top)], axis=1)
 
 
 def fill_polygon_with_rectangles(
@@ -112,8 +224,9 @@ def fill_polygon_with_rectangles(
 
     polygons = [glyph_polygon] if isinstance(glyph_polygon, Polygon) else list(glyph_polygon.geoms)
     rectangles: list[Polygon] = []
+    shapely.prepare(existing_geometry)
+    occupied_bounds = shapely.bounds(shapely.get_parts(existing_geometry)).reshape(-1, 4)
     tolerance = 1e-9
-    margin = 10.0 * max(1.0, rect_width)
 
     for polygon in polygons:
         if polygon.is_empty:
@@ -125,29 +238,49 @@ def fill_polygon_with_rectangles(
         else:
             safe_polygon = polygon
 
-        min_x, min_y, max_x, max_y = safe_polygon.bounds
+        shapely.prepare(safe_polygon)
+        _, min_y, _, max_y = safe_polygon.bounds
+        edges = _scan_edges(safe_polygon)
+        vertex_ys = np.sort(shapely.get_coordinates(safe_polygon)[:, 1])
 
         if orientation.lower() == "vertical":
             raise NotImplementedError("Vertical fill not implemented yet.")
-        for offset in _generate_subdivisions(4):
+        for offset in _SUBDIVISIONS_4:
             y = min_y + offset * rect_width
             while y < max_y - tolerance:
                 y0 = y
                 y1 = min(y + rect_width, max_y)
-                bottom_line = LineString([(min_x - margin, y0 + tolerance), (max_x + margin, y0 + tolerance)])
-                top_line = LineString([(min_x - margin, y1 - tolerance), (max_x + margin, y1 - tolerance)])
-                spans_bottom = iter_line_segments_from_intersection(safe_polygon.intersection(bottom_line))
-                spans_top = iter_line_segments_from_intersection(safe_polygon.intersection(top_line))
-                spans = intersect_spans(spans_bottom, spans_top, tolerance=tolerance)
+                spans = _strip_spans(edges, y0 + tolerance, y1 - tolerance, tolerance)
+                crossing_ranges = _strip_crossing_ranges(edges, vertex_ys, y0, y1)
+                # Spans within a row are disjoint, so candidates from the same row never cover each other and
+                # the occupied geometry only needs to be merged once per row.
+                row_rectangles: list[Polygon] = []
                 for start, end in spans:
                     start += 0.01
                     end -= 0.01
                     if end - start <= tolerance:
                         continue
                     candidate = Polygon([(start, y0), (end, y0), (end, y1), (start, y1), (start, y0)])
-                    if safe_polygon.contains(candidate) and not existing_geometry.covers(candidate):
-                        rectangles.append(candidate)
-                        existing_geometry = existing_geometry.union(candidate)
+                    # A candidate starting inside the polygon is contained when no edge passes through it.
+                    inside = crossing_ranges is not None and not np.any(
+                        (crossing_ranges[:, 0] < end) & (crossing_ranges[:, 1] > start),
+                    )
+                    if not (inside or safe_polygon.contains(candidate)):
+                        continue
+                    # Only occupied pieces whose bounding boxes overlap the candidate can cover it.
+                    overlaps = (
+                        (occupied_bounds[:, 0] <= end)
+                        & (occupied_bounds[:, 2] >= start)
+                        & (occupied_bounds[:, 1] <= y1)
+                        & (occupied_bounds[:, 3] >= y0)
+                    )
+                    if not overlaps.any() or not existing_geometry.covers(candidate):
+                        row_rectangles.append(candidate)
+                if row_rectangles:
+                    rectangles.extend(row_rectangles)
+                    existing_geometry = shapely.union_all([existing_geometry, *row_rectangles])
+                    shapely.prepare(existing_geometry)
+                    occupied_bounds = np.concatenate([occupied_bounds, shapely.bounds(row_rectangles)])
                 y += rect_width
 
     return rectangles
@@ -161,6 +294,9 @@ def _generate_subdivisions(iterations: int) -> Iterable[float]:
             yield numerator / divisor
 
 
+_SUBDIVISIONS_4: tuple[float, ...] = tuple(_generate_subdivisions(4))
+
+
 __all__ = [
     "fill_polygon_with_rectangles",
     "intersect_spans",
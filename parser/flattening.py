@@ -1,78 +1,134 @@
 """Contour flattening utilities for FreeType outlines."""
 from __future__ import annotations
 
+import functools
 import math
 from collections.abc import Sequence
 
-import bezier
 import numpy as np
 
 from .contours import FTContour
 from .geometry import Point
 
+_FT_CURVE_TAG_CONIC = 0
+_FT_CURVE_TAG_ON = 1
+_FT_CURVE_TAG_CUBIC = 2
+# Contours with more points than this skip the per-point state machine when they contain no cubic segments; below
+# it the fixed NumPy overhead of the vectorized path outweighs the Python loop.
+_VECTORIZED_CLASSIFY_MIN_POINTS = 48
 
-def flatten_contour(
-    contour: FTContour,
-    tags: Sequence[int],
-    min_segment_length: float = 1.0,
-) -> list[Point]:
-    """Sample a FreeType contour into a dense polyline.
+_GAUSS_LEGENDRE_NODES, _GAUSS_LEGENDRE_WEIGHTS = np.polynomial.legendre.leggauss(5)
+# Map the quadrature rule from [-1, 1] onto the Bézier parameter range [0, 1].
+_GAUSS_LEGENDRE_NODES = 0.5 * (_GAUSS_LEGENDRE_NODES + 1.0)
+_GAUSS_LEGENDRE_WEIGHTS = 0.5 * _GAUSS_LEGENDRE_WEIGHTS
+
+
+def _bernstein_basis(degree: int, t_values: np.ndarray) -> np.ndarray:
+    """Evaluate the Bernstein basis polynomials of ``degree`` at ``t_values``.
+
+    Returns
+    -------
+    ndarray, shape (M, degree + 1)
+        Basis weights; multiplying by the ``(degree + 1, 2)`` control points yields curve samples.
+    """
+    t_values = t_values[:, None]
+    powers = _BERNSTEIN_POWERS[degree]
+    return _BERNSTEIN_COEFFICIENTS[degree] * t_values**powers * (1.0 - t_values) ** (degree - powers)
+
+
+# Outlines only contain segments up to cubic degree, so the basis exponents and binomial coefficients are built once.
+_BERNSTEIN_POWERS = [np.arange(degree + 1) for degree in range(4)]
+_BERNSTEIN_COEFFICIENTS = [
+    np.array([math.comb(degree, power) for power in range(degree + 1)], dtype=np.float64) for degree in range(4)
+]
+# The quadrature nodes never change, so the derivative basis used for arc lengths is evaluated once per degree.
+_QUADRATURE_BASIS = {degree: _bernstein_basis(degree - 1, _GAUSS_LEGENDRE_NODES) for degree in range(1, 4)}
+
+
+def _segment_lengths(degrees: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+    """Approximate the arc lengths of Bézier segments with 5-point Gauss–Legendre quadrature.
 
     Parameters
     ----------
-    contour : FTContour
-        Contour definition with control points and on-curve flags.
-    tags : sequence of int
-        FreeType point tags for the contour. Only the lowest two bits are used.
-    min_segment_length : float, optional
-        Minimum distance between successive samples along the curve, by default ``1.0``.
+    degrees : ndarray, shape (S,)
+        Degree of each segment.
+    nodes : ndarray, shape (S, 4, 2)
+        Control points of each segment; only the first ``degree + 1`` rows are used.
 
     Returns
     -------
-    list of Point
-        Polyline approximating the contour. The contour is closed when the input is closed.
+    ndarray, shape (S,)
+        Arc length of each segment. Segments are grouped by degree so each group is integrated in a single
+        vectorized evaluation.
     """
-    if not contour.points:
-        return []
+    lengths = np.zeros(degrees.shape[0], dtype=np.float64)
+    for degree in np.unique(degrees).tolist():
+        indices = np.flatnonzero(degrees == degree)
+        if degree == 1:
+            # Straight lines have an exact closed-form length; quadrature would only add rounding noise.
+            chords = nodes[indices, 1] - nodes[indices, 0]
+            lengths[indices] = np.hypot(chords[:, 0], chords[:, 1])
+            continue
+        derivative_nodes = degree * np.diff(nodes[indices, : degree + 1], axis=1)
+        velocities = np.einsum("gk,skd->sgd", _QUADRATURE_BASIS[degree], derivative_nodes)
+        speeds = np.hypot(velocities[..., 0], velocities[..., 1])
+        lengths[indices] = speeds @ _GAUSS_LEGENDRE_WEIGHTS
+    return lengths
 
-    ft_curve_tag_conic = 0
-    ft_curve_tag_on = 1
-    ft_curve_tag_cubic = 2
 
-    def is_on(tag: int) -> bool:
-        return (tag & 3) == ft_curve_tag_on
+def _classify_segments(
+    points: np.ndarray,
+    kinds: np.ndarray,
+    degrees: np.ndarray,
+    nodes: np.ndarray,
+    offset: int,
+) -> int:
+    """Split a contour into line, quadratic and cubic Bézier segments.
 
-    def is_conic(tag: int) -> bool:
-        return (tag & 3) == ft_curve_tag_conic
+    Parameters
+    ----------
+    points : ndarray, shape (N, 2)
+        Contour control points.
+    kinds : ndarray, shape (N,)
+        Point tags reduced to their lowest two bits.
+    degrees : ndarray
+        Output buffer receiving the degree (``1``, ``2`` or ``3``) of each segment.
+    nodes : ndarray, shape (S, 4, 2)
+        Output buffer receiving the control points of each segment.
+    offset : int
+        Index of the first buffer slot to write. At most ``N + 1`` slots are written.
 
-    def is_cubic(tag: int) -> bool:
-        return (tag & 3) == ft_curve_tag_cubic
+    Returns
+    -------
+    int
+        Number of segments written, in drawing order.
+    """
+    size = points.shape[0]
+    kind_list: list[int] = kinds.tolist()
+    count = offset
 
-    points: list[Point] = contour.points
-    size = len(points)
-    if len(tags) != size:
-        msg = "Tags length must match contour point count."
-        raise ValueError(msg)
+    def emit(*control_points: np.ndarray) -> None:
+        nonlocal count
+        degrees[count] = len(control_points) - 1
+        nodes[count, : len(control_points)] = control_points
+        count += 1
 
-    if is_on(tags[0]):
+    if kind_list[0] == _FT_CURVE_TAG_ON:
         current_anchor = points[0]
         start_index = 1
+    elif kind_list[0] == _FT_CURVE_TAG_CONIC and kind_list[-1] == _FT_CURVE_TAG_CONIC:
+        current_anchor = (points[-1] + points[0]) * 0.5
+        start_index = 0
+    elif size >= 2 and kind_list[-1] == _FT_CURVE_TAG_CUBIC and kind_list[-2] == _FT_CURVE_TAG_ON:
+        current_anchor = points[-2]
+        start_index = 0
+    elif kind_list[-1] == _FT_CURVE_TAG_ON:
+        current_anchor = points[-1]
+        start_index = 0
     else:
-        if is_conic(tags[0]) and is_conic(tags[-1]):
-            implicit = ((points[-1][0] + points[0][0]) * 0.5, (points[-1][1] + points[0][1]) * 0.5)
-            current_anchor = implicit
-            start_index = 0
-        elif len(points) >= 2 and is_cubic(tags[-1]) and is_on(tags[-2]):
-            current_anchor = points[-2]
-            start_index = 0
-        elif is_on(tags[-1]):
-            current_anchor = points[-1]
-            start_index = 0
-        else:
-            current_anchor = points[0]
-            start_index = 1
+        current_anchor = points[0]
+        start_index = 1
 
-    segments: list[tuple[str, list[Point]]] = []
     consumed = 0
     index = start_index % size
     iterations = 0
@@ -80,29 +136,29 @@ def flatten_contour(
 
     while consumed < size and iterations < max_iterations:
         iterations += 1
-        tag = tags[index % size]
-        point = points[index % size]
+        kind = kind_list[index]
+        point = points[index]
 
-        if is_on(tag):
-            if point != current_anchor:
-                segments.append(("line", [current_anchor, point]))
+        if kind == _FT_CURVE_TAG_ON:
+            if point[0] != current_anchor[0] or point[1] != current_anchor[1]:
+                emit(current_anchor, point)
                 current_anchor = point
             consumed += 1
             index = (index + 1) % size
             continue
 
-        if is_conic(tag):
+        if kind == _FT_CURVE_TAG_CONIC:
             next_index = (index + 1) % size
-            next_tag = tags[next_index]
+            next_kind = kind_list[next_index]
             next_point = points[next_index]
-            if is_on(next_tag):
-                segments.append(("quadratic", [current_anchor, point, next_point]))
+            if next_kind == _FT_CURVE_TAG_ON:
+                emit(current_anchor, point, next_point)
                 current_anchor = next_point
                 consumed += 2
                 index = (index + 2) % size
-            elif is_conic(next_tag):
-                midpoint = ((point[0] + next_point[0]) * 0.5, (point[1] + next_point[1]) * 0.5)
-                segments.append(("quadratic", [current_anchor, point, midpoint]))
+            elif next_kind == _FT_CURVE_TAG_CONIC:
+                midpoint = (point + next_point) * 0.5
+                emit(current_anchor, point, midpoint)
                 current_anchor = midpoint
                 consumed += 1
                 index = (index + 1) % size
@@ -111,13 +167,13 @@ def flatten_contour(
                 index = (index + 1) % size
             continue
 
-        if is_cubic(tag):
+        if kind == _FT_CURVE_TAG_CUBIC:
             next_1 = (index + 1) % size
             next_2 = (index + 2) % size
-            if size >= 3 and is_cubic(tags[next_1]) and is_on(tags[next_2]):
+            if size >= 3 and kind_list[next_1] == _FT_CURVE_TAG_CUBIC and kind_list[next_2] == _FT_CURVE_TAG_ON:
                 p1 = points[next_1]
                 p2 = points[next_2]
-                segments.append(("cubic", [current_anchor, point, p1, p2]))
+                emit(current_anchor, point, p1, p2)
                 current_anchor = p2
                 consumed += 3
                 index = (index + 3) % size
@@ -129,68 +185,245 @@ def flatten_contour(
         consumed += 1
         index = (index + 1) % size
 
-    if segments:
-        first_point = segments[0][1][0]
-        if current_anchor != first_point:
-            segments.append(("line", [current_anchor, first_point]))
-
-    polyline: list[Point] = []
-    if not segments:
-        return polyline
-
-    start_point = segments[0][1][0]
-    polyline.append((float(start_point[0]), float(start_point[1])))
-
-    for segment_type, control_points in segments:
-        if segment_type == "line":
-            nodes = np.asfortranarray(
-                [
-                    [control_points[0][0], control_points[1][0]],
-                    [control_points[0][1], control_points[1][1]],
-                ],
-                dtype=float,
-            )
-            curve = bezier.Curve(nodes, degree=1)
-        elif segment_type == "quadratic":
-            nodes = np.asfortranarray(
-                [
-                    [control_points[0][0], control_points[1][0], control_points[2][0]],
-                    [control_points[0][1], control_points[1][1], control_points[2][1]],
-                ],
-                dtype=float,
-            )
-            curve = bezier.Curve(nodes, degree=2)
-        elif segment_type == "cubic":
-            nodes = np.asfortranarray(
-                [
-                    [
-                        control_points[0][0],
-                        control_points[1][0],
-                        control_points[2][0],
-                        control_points[3][0],
-                    ],
-                    [
-                        control_points[0][1],
-                        control_points[1][1],
-                        control_points[2][1],
-                        control_points[3][1],
-                    ],
-                ],
-                dtype=float,
-            )
-            curve = bezier.Curve(nodes, degree=3)
+    if count > offset:
+        first_point = nodes[offset, 0].copy()
+        if current_anchor[0] != first_point[0] or current_anchor[1] != first_point[1]:
+            emit(current_anchor, first_point)
+
+    return count - offset
+
+
+def _sample_segments(degrees: np.ndarray, nodes: np.ndarray, sample_counts: np.ndarray) -> np.ndarray:
+    """Evaluate every segment at ``t = 1/n, 2/n, ..., 1`` in one batch per degree.
+
+    Parameters
+    ----------
+    degrees : ndarray, shape (S,)
+        Degree of each segment.
+    nodes : ndarray, shape (S, 4, 2)
+        Control points of each segment; only the first ``degree + 1`` rows are used.
+    sample_counts : ndarray, shape (S,)
+        Number of samples ``n`` to take along each segment.
+
+    Returns
+    -------
+    ndarray, shape (sum(sample_counts), 2)
+        Samples of all segments, concatenated in segment order.
+    """
+    total = int(sample_counts.sum())
+    segment_of_sample = np.repeat(np.arange(degrees.shape[0]), sample_counts)
+    first_sample = np.repeat(np.cumsum(sample_counts) - sample_counts, sample_counts)
+    t_values = (np.arange(total) - first_sample + 1) / np.repeat(sample_counts, sample_counts)
+
+    samples = np.empty((total, 2), dtype=np.float64)
+    sample_degrees = degrees[segment_of_sample]
+    for degree in np.unique(degrees).tolist():
+        rows = np.flatnonzero(sample_degrees == degree)
+        control_points = nodes[segment_of_sample[rows], : degree + 1]
+        if degree == 1:
+            # Straight lines only need a lerp; the (1 - t) * a + t * b form lands exactly on the endpoint at t = 1.
+            t_line = t_values[rows, None]
+            samples[rows] = (1.0 - t_line) * control_points[:, 0] + t_line * control_points[:, 1]
         else:
-            continue
+            basis = _bernstein_basis(degree, t_values[rows])
+            samples[rows] = np.einsum("mk,mkd->md", basis, control_points)
+    return samples
+
+
+def _classify_quadratic_segments(
+    points: np.ndarray,
+    on_curve: np.ndarray,
+    degrees: np.ndarray,
+    nodes: np.ndarray,
+    offset: int,
+) -> int:
+    """Vectorized :func:`_classify_segments` for contours made only of lines and quadratic Béziers.
+
+    Parameters
+    ----------
+    points : ndarray, shape (N, 2)
+        Contour control points.
+    on_curve : ndarray of bool, shape (N,)
+        ``True`` for on-curve points and ``False`` for conic control points.
+    degrees, nodes, offset
+        Output buffers and first slot, see :func:`_classify_segments`.
+
+    Returns
+    -------
+    int
+        Number of segments written, in the same order as :func:`_classify_segments` produces them.
+    """
+    # Walk the contour as one open chain from the start anchor back to it, mirroring the state machine's choice
+    # of starting point.
+    if on_curve[0]:
+        anchor = points[0]
+        chain = np.concatenate([points[:1], points[1:], points[:1]])
+        chain_on = np.concatenate([[True], on_curve[1:], [True]])
+    elif not on_curve[-1]:
+        anchor = (points[-1] + points[0]) * 0.5
+        chain = np.concatenate([anchor[None], points, anchor[None]])
+        chain_on = np.concatenate([[True], on_curve, [True]])
+    else:
+        chain = np.concatenate([points[-1:], points])
+        chain_on = np.concatenate([[True], on_curve])
+        anchor = chain[0]
 
-        length = float(curve.length)
-        segments_count = max(1, int(math.floor(length / max(1e-12, min_segment_length))))
+    # Consecutive conic control points imply an on-curve midpoint between them.
+    implied = np.flatnonzero(~chain_on[:-1] & ~chain_on[1:]) + 1
+    if implied.shape[0]:
+        midpoints = (chain[implied - 1] + chain[implied]) * 0.5
+        chain = np.insert(chain, implied, midpoints, axis=0)
+        chain_on = np.insert(chain_on, implied, True)
 
-        for piece_index in range(1, segments_count + 1):
-            t_value = piece_index / segments_count
-            point_value = curve.evaluate(t_value).flatten()
-            polyline.append((float(point_value[0]), float(point_value[1])))
+    on_index = np.flatnonzero(chain_on)
+    starts = on_index[:-1]
+    ends = on_index[1:]
+    quadratic = (ends - starts) == 2
+    # Lines that do not move away from the current anchor are dropped, as in the state machine.
+    moving = np.any(chain[starts] != chain[ends], axis=1)
+    keep = quadratic | moving
+    starts = starts[keep]
+    ends = ends[keep]
+    quadratic = quadratic[keep]
+
+    count = starts.shape[0]
+    segment_degrees = np.where(quadratic, 2, 1)
+    degrees[offset : offset + count] = segment_degrees
+    nodes[offset : offset + count, 0] = chain[starts]
+    nodes[offset : offset + count, 1] = np.where(quadratic[:, None], chain[starts + 1], chain[ends])
+    nodes[offset : offset + count, 2] = chain[ends]
+    return count
+
+
+def flatten_contour(
+    contour: FTContour,
+    tags: Sequence[int],
+    min_segment_length: float = 1.0,
+) -> list[Point]:
+    """Sample a FreeType contour into a dense polyline.
+
+    Parameters
+    ----------
+    contour : FTContour
+        Contour definition with control points and on-curve flags.
+    tags : sequence of int
+        FreeType point tags for the contour. Only the lowest two bits are used.
+    min_segment_length : float, optional
+        Minimum distance between successive samples along the curve, by default ``1.0``.
+
+    Returns
+    -------
+    list of Point
+        Polyline approximating the contour. The contour is closed when the input is closed. Results for identical
+        contours are memoised, so repeated calls only copy the cached polyline.
+    """
+    points = np.ascontiguousarray(contour.points, dtype=np.float64)
+    key_tags = tuple(int(tag) for tag in tags)
+    return list(_flatten_contour_cached(points.tobytes(), tuple(contour.on_curve), key_tags, float(min_segment_length)))
+
+
+@functools.lru_cache(maxsize=4096)
+def _flatten_contour_cached(
+    points: bytes,
+    on_curve: tuple[bool, ...],
+    tags: tuple[int, ...],
+    min_segment_length: float,
+) -> tuple[Point, ...]:
+    """Flatten one contour given in hashable form; the immutable result is shared between callers."""
+    contour = FTContour(points=np.frombuffer(points, dtype=np.float64).reshape(-1, 2), on_curve=on_curve)
+    return tuple(flatten_contours([contour], [tags], min_segment_length=min_segment_length)[0])
+
+
+def flatten_contours(
+    contours: Sequence[FTContour],
+    tags_per_contour: Sequence[Sequence[int]],
+    min_segment_length: float = 1.0,
+) -> list[list[Point]]:
+    """Sample all contours of a glyph into dense polylines in one pass.
+
+    Parameters
+    ----------
+    contours : sequence of FTContour
+        Contour definitions with control points and on-curve flags.
+    tags_per_contour : sequence of sequence of int
+        FreeType point tags for each contour. Only the lowest two bits are used.
+    min_segment_length : float, optional
+        Minimum distance between successive samples along the curves, by default ``1.0``.
+
+    Returns
+    -------
+    list of list of Point
+        One polyline per contour, see :func:`flatten_contour`.
+    """
+    polylines = flatten_contours_to_arrays(contours, tags_per_contour, min_segment_length=min_segment_length)
+    return [list(map(tuple, polyline.tolist())) for polyline in polylines]
+
+
+def flatten_contours_to_arrays(
+    contours: Sequence[FTContour],
+    tags_per_contour: Sequence[Sequence[int]],
+    min_segment_length: float = 1.0,
+) -> list[np.ndarray]:
+    """Sample all contours of a glyph into dense polylines stored as coordinate arrays.
+
+    Segments of every contour are written into one shared control-point buffer and their arc lengths are
+    integrated together, which amortizes the NumPy dispatch overhead across the whole glyph instead of paying
+    it per segment.
+
+    Parameters
+    ----------
+    contours : sequence of FTContour
+        Contour definitions with control points and on-curve flags.
+    tags_per_contour : sequence of sequence of int
+        FreeType point tags for each contour. Only the lowest two bits are used.
+    min_segment_length : float, optional
+        Minimum distance between successive samples along the curves, by default ``1.0``.
+
+    Returns
+    -------
+    list of ndarray, shape (M, 2)
+        One polyline per contour, see :func:`flatten_contour`. Empty contours yield ``(0, 2)`` arrays.
+    """
+    point_arrays = [np.asarray(contour.points, dtype=np.float64).reshape(-1, 2) for contour in contours]
+    for points, tags in zip(point_arrays, tags_per_contour):
+        if len(tags) != points.shape[0]:
+            msg = "Tags length must match contour point count."
+            raise ValueError(msg)
+
+    # Each contour yields at most one segment per point plus the closing line.
+    capacity = sum(points.shape[0] + 1 for points in point_arrays)
+    degrees = np.empty(capacity, dtype=np.int64)
+    nodes = np.empty((capacity, 4, 2), dtype=np.float64)
+
+    segment_ranges: list[tuple[int, int]] = []
+    total = 0
+    for points, tags in zip(point_arrays, tags_per_contour):
+        count = 0
+        if points.shape[0]:
+            kinds = np.asarray(tags, dtype=np.int64) & 3
+            if points.shape[0] > _VECTORIZED_CLASSIFY_MIN_POINTS and np.all(kinds <= _FT_CURVE_TAG_ON):
+                count = _classify_quadratic_segments(points, kinds == _FT_CURVE_TAG_ON, degrees, nodes, total)
+            else:
+                count = _classify_segments(points, kinds, degrees, nodes, total)
+        segment_ranges.append((total, total + count))
+        total += count
+
+    degrees = degrees[:total]
+    nodes = nodes[:total]
+    lengths = _segment_lengths(degrees, nodes)
+    sample_counts = np.maximum(1, np.floor(lengths / max(1e-12, min_segment_length)).astype(np.int64))
+    samples = _sample_segments(degrees, nodes, sample_counts)
+    sample_offsets: list[int] = np.concatenate([[0], np.cumsum(sample_counts)]).tolist()
+
+    polylines: list[np.ndarray] = []
+    for first, last in segment_ranges:
+        if last > first:
+            polyline = np.concatenate([nodes[first, :1], samples[sample_offsets[first] : sample_offsets[last]]])
+        else:
+            polyline = np.empty((0, 2), dtype=np.float64)
+        polylines.append(polyline)
 
-    return polyline
+    return polylines
 
 
-__all__ = ["flatten_contour"]
+__all__ = ["flatten_contour", "flatten_contours", "flatten_contours_to_arrays"]
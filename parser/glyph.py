@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
+import functools
 from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal
 
+import numpy as np
+import shapely
 from fontTools.ttLib import TTFont
 from shapely.geometry import Polygon
 
 from .contours import FTContour, fonttools_outline_to_contours
-from .flattening import flatten_contour
+from .flattening import flatten_contours_to_arrays
 from .geometry import Point, polygon_is_ccw
+from .simplification import rdp_simplify
 
 
 @dataclass(slots=True)
@@ -37,17 +41,26 @@ class GlyphOutline:
 FontInput = TTFont | str | Path | None
 
 
-def _resolve_ttfont(font_path: str | Path | None) -> tuple[TTFont, bool]:
+@functools.lru_cache(maxsize=32)
+def _load_ttfont(path: str, mtime: float) -> TTFont:
+    """Open a font file once per path and modification time.
+
+    Tables are decompiled lazily, so only those touched by the outline extraction are parsed. The returned font is
+    shared between callers and must not be closed.
+    """
+    return TTFont(path, lazy=True)
+
+
+def _resolve_ttfont(font_path: FontInput) -> tuple[TTFont, bool]:
     if isinstance(font_path, TTFont):
         return font_path, False
     if isinstance(font_path, (str, Path)):
-        return TTFont(font_path), True
+        resolved = Path(font_path).resolve()
+        return _load_ttfont(str(resolved), resolved.stat().st_mtime), False
     if font_path is None:
-        if font_path is None:
-            msg = "font or font_path must be provided when backend='fonttools'."
-            raise ValueError(msg)
-        return TTFont(font_path), True
-    msg = f"Unsupported font argument type: {type(font).__name__}"
+        msg = "font or font_path must be provided when backend='fonttools'."
+        raise ValueError(msg)
+    msg = f"Unsupported font argument type: {type(font_path).__name__}"
     raise TypeError(msg)
 
 
@@ -56,6 +69,7 @@ def _build_outline(
     tags_per_contour: Sequence[Sequence[int]],
     reversed_fill: bool,
     min_segment_length: float,
+    rdp_epsilon: float = 0.0,
 ) -> GlyphOutline:
     if len(contours) != len(tags_per_contour):
         msg = "Contour and tag counts must match."
@@ -68,13 +82,18 @@ def _build_outline(
         if len(contour.points) != len(tags):
             msg = "Contour points and tag lengths do not match."
             raise ValueError(msg)
-        polyline = flatten_contour(contour, tags, min_segment_length=min_segment_length)
-        if len(polyline) < 4:
+
+    for polyline in flatten_contours_to_arrays(contours, tags_per_contour, min_segment_length=min_segment_length):
+        if rdp_epsilon > 0.0:
+            polyline = rdp_simplify(polyline, rdp_epsilon)
+        if polyline.shape[0] < 4:
             continue
+        # Coordinates stay in arrays through simplification and orientation tests; tuples are only built here.
+        points: list[Point] = list(map(tuple, polyline.tolist()))
         if polygon_is_ccw(polyline) ^ reversed_fill:
-            exteriors.append(polyline)
+            exteriors.append(points)
         else:
-            holes.append(polyline)
+            holes.append(points)
 
     if not exteriors:
         msg = "Glyph does not contain an exterior contour."
@@ -91,7 +110,7 @@ def _infer_reversed_fill(contours: Sequence[FTContour]) -> bool:
 
 
 def get_glyph_outline(
-    face_path: str,
+    face_path: str | None,
     char: str,
     pixel_height: int,
     min_segment_length: float = 1.0,
@@ -116,12 +135,13 @@ def get_glyph_outline(
         Outline extraction backend. ``"freetype"`` uses the existing FreeType pipeline,
         while ``"fonttools"`` extracts contours via FontTools, by default ``"freetype"``.
     font : TTFont or path-like, optional
-        Pre-loaded FontTools ``TTFont`` instance or path used when ``backend`` is ``"fonttools"``.
+        Pre-loaded FontTools ``TTFont`` instance or path used instead of ``face_path`` when ``backend`` is
+        ``"fonttools"``. Reusing one instance across calls avoids reopening the font.
     font_path : str or Path, optional
         Alternate path to the font file used when ``backend`` is ``"fonttools"`` and
         ``font`` is not supplied.
     rdp_epsilon : float, optional
-        Placeholder for Ramer–Douglas–Peucker simplification tolerance, currently unused.
+        Ramer–Douglas–Peucker tolerance applied to each flattened polyline, by default ``0.0`` (disabled).
 
     Returns
     -------
@@ -134,20 +154,18 @@ def get_glyph_outline(
     #     face = freetype.Face(face_path)
 
     #     contours, flags = freetype_outline_to_contours(face, char, pixel_height)
-    #     outline = face.glyph.outline
+    #     tags = np.asarray(face.glyph.outline.tags, dtype=np.uint8)
 
-    #     tags_per_contour: list[list[int]] = []
-    #     start_index = 0
-    #     for contour in contours:
-    #         count = len(contour.points)
-    #         tags_per_contour.append(outline.tags[start_index : start_index + count])
-    #         start_index += count
+    #     # One array of tags for the whole glyph; each contour gets a view instead of a freshly built list.
+    #     offsets = np.cumsum([0, *(len(contour.points) for contour in contours)]).tolist()
+    #     tags_per_contour = [tags[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
 
     #     reversed_fill = flags & freetype.FT_OUTLINE_FLAGS["FT_OUTLINE_REVERSE_FILL"] == 0
-    #     return _build_outline(contours, tags_per_contour, reversed_fill, min_segment_length)
+    #     return _build_outline(contours, tags_per_contour, reversed_fill, min_segment_length, rdp_epsilon)
 
     if backend_value == "fonttools":
-        ttfont, close_after = _resolve_ttfont(face_path)
+        # A pre-loaded font skips path resolution entirely; its parsed tables and contours are cached per instance.
+        ttfont, close_after = _resolve_ttfont(font if font is not None else face_path)
         try:
             contours, tags_per_contour = fonttools_outline_to_contours(ttfont, char, pixel_height)
         finally:
@@ -155,12 +173,31 @@ def get_glyph_outline(
                 ttfont.close()
 
         reversed_fill = _infer_reversed_fill(contours)
-        return _build_outline(contours, tags_per_contour, reversed_fill, min_segment_length)
+        return _build_outline(contours, tags_per_contour, reversed_fill, min_segment_length, rdp_epsilon)
 
     msg = f"Unsupported backend value: {backend}"
     raise ValueError(msg)
 
 
+def _rings_to_polygons(rings: Sequence[Sequence[Point]]) -> np.ndarray:
+    """Build hole-free polygons for a ragged list of rings in a single vectorized shapely call.
+
+    Parameters
+    ----------
+    rings : sequence of sequence of Point
+        Ring vertices. Rings are closed automatically when the last vertex differs from the first.
+
+    Returns
+    -------
+    ndarray of Polygon, shape (len(rings),)
+        One polygon per input ring, in input order.
+    """
+    arrays = [np.asarray(ring, dtype=np.float64).reshape(-1, 2) for ring in rings]
+    sizes = [array.shape[0] for array in arrays]
+    indices = np.repeat(np.arange(len(arrays)), sizes)
+    return shapely.polygons(shapely.linearrings(np.concatenate(arrays), indices=indices))
+
+
 def outline_to_polygon(outline: GlyphOutline) -> Polygon:
     """Convert a glyph outline into a shapely polygon (with holes).
 
@@ -174,26 +211,39 @@ def outline_to_polygon(outline: GlyphOutline) -> Polygon:
     Polygon
         Polygon geometry describing the glyph.
     """
-    exterior_polygons = [Polygon(ring) for ring in outline.exteriors if len(ring) >= 3]
-    if not exterior_polygons:
+    exterior_rings = [ring for ring in outline.exteriors if len(ring) >= 3]
+    if not exterior_rings:
         msg = "Outline does not contain any exterior polygons."
         raise ValueError(msg)
 
-    union = exterior_polygons[0].buffer(0)
-    for polygon in exterior_polygons[1:]:
-        union = union.union(polygon.buffer(0))
-
-    for hole in outline.holes:
-        if len(hole) >= 3:
-            union = union.difference(Polygon(hole))
+    hole_rings = [ring for ring in outline.holes if len(ring) >= 3]
+    if len(exterior_rings) == 1 and not hole_rings:
+        # Most simple glyphs are a single clean ring, which needs neither overlays nor component selection.
+        polygon = Polygon(exterior_rings[0])
+        if polygon.is_valid:
+            return polygon
+
+    # Exteriors and holes are constructed together; they are only overlaid separately.
+    ring_polygons = _rings_to_polygons(exterior_rings + hole_rings)
+    exteriors = ring_polygons[: len(exterior_rings)]
+    holes = ring_polygons[len(exterior_rings) :]
+    # Only rings that actually self-intersect need repairing; well-formed outlines skip the GEOS rebuild entirely.
+    invalid = ~shapely.is_valid(exteriors)
+    if invalid.any():
+        exteriors[invalid] = shapely.make_valid(exteriors[invalid], method="structure", keep_collapsed=False)
+
+    # Overlay all exteriors and all holes in one GEOS call each instead of re-noding the accumulated union per ring.
+    union = shapely.union_all(exteriors)
+    if holes.size:
+        union = shapely.difference(union, shapely.union_all(holes))
 
     if union.geom_type == "Polygon":
         return union
 
     if union.geom_type == "MultiPolygon":
-        # ``buffer(0)`` cleans up geometry but may split components. Keep the largest component.
-        polygons = sorted(union.geoms, key=lambda geom: geom.area, reverse=True)
-        return Polygon(polygons[0].exterior.coords, [list(interior.coords) for interior in polygons[0].interiors])
+        # Repairing self-intersections and cutting holes may split components. Keep the largest component.
+        parts = shapely.get_parts(union)
+        return parts[int(np.argmax(shapely.area(parts)))]
 
     msg = f"Unexpected geometry type produced from outline: {union.geom_type}"
     raise ValueError(msg)
@@ -2,12 +2,52 @@
 
 from __future__ import annotations
 
-from shapely.geometry import MultiPolygon, Polygon
-from shapely.ops import unary_union
+import functools
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import shapely
 
 from .fill import fill_polygon_with_rectangles
-from .glyph import GlyphOutline, get_glyph_outline, outline_to_polygon
-from .rectangles import extend_rectangles, rectangles_along_polyline
+from .glyph import GlyphOutline, _resolve_ttfont, get_glyph_outline, outline_to_polygon
+from .rectangles import corners_to_rectangles, extend_rectangle_corners, rectangle_corners_along_polylines
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from shapely.geometry import MultiPolygon, Polygon
+
+
+@functools.lru_cache(maxsize=512)
+def _glyph_geometry(
+    face_path: str,
+    mtime: int,
+    char: str,
+    pixel_height: int,
+    min_segment_length: float,
+    rdp_epsilon: float,
+    backend: str,
+) -> tuple[GlyphOutline, Polygon]:
+    """Return the outline and polygon of a glyph, reusing earlier results for identical arguments.
+
+    The polygon is prepared before it is cached, so the spatial index behind the ``covers`` tests in
+    :func:`extend_rectangles` and :func:`fill_polygon_with_rectangles` is built once per glyph rather than once per
+    call. The returned objects are shared between calls and must not be mutated. ``mtime`` is only part of the cache
+    key, so a font file replaced on disk is read afresh.
+    """
+    outline: GlyphOutline = get_glyph_outline(
+        face_path,
+        char,
+        pixel_height,
+        min_segment_length=min_segment_length,
+        rdp_epsilon=rdp_epsilon,
+        backend=backend,
+    )
+    glyph_polygon = outline_to_polygon(outline)
+    shapely.prepare(glyph_polygon)
+    return outline, glyph_polygon
 
 
 def build_rectangles_for_glyph(
@@ -53,39 +93,41 @@ def build_rectangles_for_glyph(
         Individual rectangles used to approximate the glyph.
     """
 
-    outline: GlyphOutline = get_glyph_outline(
+    outline, glyph_polygon = _glyph_geometry(
         face_path,
+        Path(face_path).stat().st_mtime_ns,
         char,
         pixel_height,
-        min_segment_length=min_segment_length,
-        rdp_epsilon=rdp_epsilon,
-        backend=backend,
+        min_segment_length,
+        rdp_epsilon,
+        backend,
     )
 
-    glyph_polygon = outline_to_polygon(outline)
-
-    boundary_rectangles: list[Polygon] = []
-    for ring in outline.exteriors:
-        boundary_rectangles.extend(
-            rectangles_along_polyline(ring, thickness, overlap, interior_is_right=outline.reversed_fill),
-        )
-    for ring in outline.holes:
-        boundary_rectangles.extend(
-            rectangles_along_polyline(
-                ring,
+    # Boundary rectangles stay as corner arrays through placement and extension and become polygons only once.
+    boundary_corners = np.concatenate(
+        [
+            rectangle_corners_along_polylines(
+                outline.exteriors,
+                thickness,
+                overlap,
+                interior_is_right=outline.reversed_fill,
+            ),
+            rectangle_corners_along_polylines(
+                outline.holes,
                 thickness,
                 overlap,
                 interior_is_right=outline.reversed_fill,
                 remove_narrow=False,
             ),
-        )
-
-    boundary_rectangles = extend_rectangles(glyph_polygon, boundary_rectangles, thickness)
+        ],
+    )
+    boundary_corners = extend_rectangle_corners(glyph_polygon, boundary_corners, thickness)
 
-    if not boundary_rectangles:
+    if not boundary_corners.shape[0]:
         return glyph_polygon, []
 
-    boundary_union = unary_union(boundary_rectangles)
+    boundary_rectangles = corners_to_rectangles(boundary_corners)
+    boundary_union = shapely.union_all(boundary_rectangles)
     interior_rectangles = fill_polygon_with_rectangles(
         glyph_polygon=glyph_polygon,
         existing_geometry=boundary_union,
@@ -95,14 +137,96 @@ def build_rectangles_for_glyph(
     )
 
     all_rectangles = boundary_rectangles + interior_rectangles
-    combined = unary_union(all_rectangles)
+    # The boundary rectangles are already merged, so only the interior ones still need to be overlaid.
+    combined = shapely.union_all([boundary_union, *interior_rectangles]) if interior_rectangles else boundary_union
 
-    if glyph_polygon.geom_type == "Polygon":
-        combined = combined.intersection(glyph_polygon)
-    else:
-        combined = combined.intersection(MultiPolygon(glyph_polygon.geoms))
+    combined = shapely.intersection(combined, glyph_polygon)
 
     return combined, all_rectangles
 
 
-__all__ = ["build_rectangles_for_glyph"]
+def build_rectangles_for_glyphs(
+    face_path: str,
+    chars: Sequence[str],
+    *,
+    max_workers: int | None = None,
+    **kwargs: Any,
+) -> list[tuple[Polygon | MultiPolygon, list[Polygon]]]:
+    """Run the glyph pipeline for several characters concurrently.
+
+    The heavy lifting happens in GEOS, which releases the GIL, so the glyphs are processed on a thread pool. The
+    font is opened once and shared between the workers. Repeated characters are processed once, so no two threads
+    work on the same cached glyph geometry, and their entries in the result share the same objects.
+
+    Parameters
+    ----------
+    face_path : str
+        Path to the font file containing the glyphs.
+    chars : sequence of str
+        Glyph characters to process.
+    max_workers : int, optional
+        Maximum number of worker threads, by default chosen by :class:`~concurrent.futures.ThreadPoolExecutor`.
+    **kwargs
+        Additional keyword arguments forwarded to :func:`build_rectangles_for_glyph`.
+
+    Returns
+    -------
+    list of tuple
+        ``(combined, rectangles)`` pairs as returned by :func:`build_rectangles_for_glyph`, in input order.
+    """
+    unique_chars = list(dict.fromkeys(chars))
+    build = functools.partial(build_rectangles_for_glyph, face_path, **kwargs)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = dict(zip(unique_chars, executor.map(build, unique_chars)))
+    return [results[char] for char in chars]
+
+
+def _load_worker_font(face_path: str) -> None:
+    """Parse the font once when a worker process starts so every glyph it handles reuses the cached instance."""
+    _resolve_ttfont(face_path)
+
+
+def _build_glyph_wkb(face_path: str, char: str, kwargs: dict[str, Any]) -> tuple[bytes, np.ndarray]:
+    """Run :func:`build_rectangles_for_glyph` in a worker and serialise the result as WKB."""
+    combined, rectangles = build_rectangles_for_glyph(face_path, char, **kwargs)
+    return shapely.to_wkb(combined), shapely.to_wkb(np.asarray(rectangles, dtype=object))
+
+
+def build_rectangles_for_string(
+    face_path: str,
+    text: str,
+    *,
+    max_workers: int | None = None,
+    **kwargs: Any,
+) -> list[tuple[Polygon | MultiPolygon, list[Polygon]]]:
+    """Run the glyph pipeline for every character of a string on a process pool.
+
+    Unlike :func:`build_rectangles_for_glyphs`, the Python parts of the pipeline (flattening, RDP, scanline fill)
+    also run in parallel. Each worker parses the font once on start-up, and results cross the process boundary as
+    WKB so only flat byte strings are pickled.
+
+    Parameters
+    ----------
+    face_path : str
+        Path to the font file containing the glyphs.
+    text : str
+        Characters to process.
+    max_workers : int, optional
+        Maximum number of worker processes, by default chosen by :class:`~concurrent.futures.ProcessPoolExecutor`.
+    **kwargs
+        Additional keyword arguments forwarded to :func:`build_rectangles_for_glyph`.
+
+    Returns
+    -------
+    list of tuple
+        ``(combined, rectangles)`` pairs as returned by :func:`build_rectangles_for_glyph`, in input order.
+    """
+    if not text:
+        return []
+    build = functools.partial(_build_glyph_wkb, face_path, kwargs=kwargs)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_load_worker_font, initargs=(face_path,)) as executor:
+        results = list(executor.map(build, text))
+    return [(shapely.from_wkb(combined), shapely.from_wkb(rectangles).tolist()) for combined, rectangles in results]
+
+
+__all__ = ["build_rectangles_for_glyph", "build_rectangles_for_glyphs", "build_rectangles_for_string"]
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import itertools
+import math
 from collections.abc import Sequence
 
-from shapely.geometry import Point as ShapelyPoint
+import numpy as np
+import shapely
 from shapely.geometry import Polygon
 
 from .geometry import Point, add, norm, rotate90_ccw, rotate90_cw, scale, subtract, unit_vector
@@ -30,61 +33,170 @@ def rectangles_along_polyline(
     interior_is_right : bool
         ``True`` when the interior is located to the right-hand side of the polyline.
     remove_narrow : bool, optional
-        When ``True`` repeatedly prunes narrow regions before tiling, by default ``True``.
+        When ``True`` prunes narrow regions before tiling, by default ``True``.
 
     Returns
     -------
     list of Polygon
         Rectangles aligned with the boundary segments.
     """
-    if len(polyline) < 2:
-        return []
+    return rectangles_along_polylines(
+        [polyline],
+        thickness,
+        overlap,
+        interior_is_right=interior_is_right,
+        remove_narrow=remove_narrow,
+    )
 
-    polygon = Polygon(polyline)
-    polygon = polygon.segmentize(1.0)
-    working_polyline: Sequence[Point] = list(polygon.exterior.coords)
-
-    while len(working_polyline) > 4 and remove_narrow:
-        polygon = Polygon(working_polyline)
-        working_polyline, removed_indices = remove_narrow_areas(
-            working_polyline,
-            polygon,
-            thickness,
-            overlap,
-            interior_is_right=interior_is_right,
-        )
-        if not removed_indices:
-            break
-        working_polyline = [working_polyline[-1], *working_polyline[:-1]]
-
-    if len(working_polyline) > 4:
-        polygon = Polygon(working_polyline)
-        polygon = polygon.simplify(0.01)
-        if isinstance(polygon, Polygon):
-            working_polyline = list(polygon.exterior.coords)
-        else:
-            raise RuntimeError("Unexpected geometry type after simplification.")
 
-    rectangles: list[Polygon] = []
-    for start, end in zip(working_polyline[:-1], working_polyline[1:]):
-        segment = subtract(end, start)
-        length = norm(segment)
-        if length == 0.0:
+def rectangles_along_polylines(
+    polylines: Sequence[Sequence[Point]],
+    thickness: float,
+    overlap: float,
+    *,
+    interior_is_right: bool,
+    remove_narrow: bool = True,
+) -> list[Polygon]:
+    """Place rectangles flush against several polygonal boundaries at once.
+
+    The boundaries are simplified with a single vectorized GEOS call and their rectangles are built together, so
+    processing all rings of a glyph costs a constant number of GEOS round-trips.
+
+    Parameters
+    ----------
+    polylines : sequence of sequence of Point
+        Ordered vertices describing each boundary.
+    thickness : float
+        Inward rectangle depth.
+    overlap : float
+        Overlap distance used to avoid gaps between consecutive rectangles.
+    interior_is_right : bool
+        ``True`` when the interior is located to the right-hand side of the polylines.
+    remove_narrow : bool, optional
+        When ``True`` prunes narrow regions before tiling, by default ``True``.
+
+    Returns
+    -------
+    list of Polygon
+        Rectangles aligned with the boundary segments, in polyline order.
+    """
+    corners = rectangle_corners_along_polylines(
+        polylines,
+        thickness,
+        overlap,
+        interior_is_right=interior_is_right,
+        remove_narrow=remove_narrow,
+    )
+    return corners_to_rectangles(corners)
+
+
+def rectangle_corners_along_polylines(
+    polylines: Sequence[Sequence[Point]],
+    thickness: float,
+    overlap: float,
+    *,
+    interior_is_right: bool,
+    remove_narrow: bool = True,
+) -> np.ndarray:
+    """Compute the corners of the boundary rectangles without building shapely polygons.
+
+    Parameters are the same as for :func:`rectangles_along_polylines`.
+
+    Returns
+    -------
+    ndarray, shape (N, 4, 2)
+        Corners ``(a, b, inner_b, inner_a)`` of each rectangle, where ``a -> b`` is the boundary segment and the inner
+        corners are offset by ``thickness`` towards the interior.
+    """
+    rings: list[np.ndarray] = []
+    for polyline in polylines:
+        if len(polyline) < 2:
             continue
-        direction = unit_vector(segment)
-        normal = rotate90_cw(direction) if interior_is_right else rotate90_ccw(direction)
+        points = np.asarray(polyline, dtype=np.float64).reshape(-1, 2)
+        if (points[0] != points[-1]).any():
+            points = np.concatenate([points, points[:1]])
+        points = _segmentize(points, 1.0)
+
+        if remove_narrow:
+            points = _prune_narrow_vertices(points, thickness, overlap, interior_is_right=interior_is_right)
+        rings.append(points)
+
+    to_simplify = [index for index, points in enumerate(rings) if points.shape[0] > 4]
+    if to_simplify:
+        coords = np.concatenate([rings[index] for index in to_simplify])
+        ring_ids = np.repeat(np.arange(len(to_simplify)), [rings[index].shape[0] for index in to_simplify])
+        simplified = shapely.simplify(shapely.polygons(shapely.linearrings(coords, indices=ring_ids)), 0.01)
+        if np.any(shapely.get_type_id(simplified) != shapely.GeometryType.POLYGON):
+            raise RuntimeError("Unexpected geometry type after simplification.")
+        coords, ring_ids = shapely.get_coordinates(shapely.get_exterior_ring(simplified), return_index=True)
+        split_at = np.flatnonzero(np.diff(ring_ids)) + 1
+        for index, points in zip(to_simplify, np.split(coords, split_at)):
+            rings[index] = points
+
+    if not rings:
+        return np.empty((0, 4, 2))
+
+    starts = np.concatenate([points[:-1] for points in rings])
+    ends = np.concatenate([points[1:] for points in rings])
+    segments = subtract(ends, starts)
+    # A rectangle is a valid, non-empty polygon exactly when both its side lengths are non-zero and finite.
+    lengths = norm(segments)
+    keep = (lengths != 0.0) & np.isfinite(lengths) & (thickness != 0.0) & math.isfinite(thickness)
+    starts = starts[keep]
+    ends = ends[keep]
+    direction = unit_vector(segments[keep])
+    normal = rotate90_cw(direction) if interior_is_right else rotate90_ccw(direction)
+    offset = scale(normal, thickness)
+    inner_start = add(starts, offset)
+    inner_end = add(ends, offset)
+    return np.stack([starts, ends, inner_end, inner_start], axis=1)
+
+
+def corners_to_rectangles(corners: np.ndarray) -> list[Polygon]:
+    """Build rectangle polygons from a corner array in one vectorized shapely call.
+
+    Parameters
+    ----------
+    corners : ndarray, shape (N, 4, 2)
+        Rectangle corners ordered ``(a, b, inner_b, inner_a)`` as produced by :func:`rectangle_corners_along_polylines`.
 
-        extended_start = start
-        extended_end = end
-        inner_start = add(extended_start, scale(normal, thickness))
-        inner_end = add(extended_end, scale(normal, thickness))
+    Returns
+    -------
+    list of Polygon
+        One closed rectangle per row of ``corners``.
+    """
+    return _corner_polygons(corners).tolist()
 
-        rectangle_coords = [extended_start, extended_end, inner_end, inner_start, extended_start]
-        rectangle = Polygon(rectangle_coords)
-        if rectangle.is_valid and not rectangle.is_empty:
-            rectangles.append(rectangle)
 
-    return rectangles
+def _corner_polygons(corners: np.ndarray) -> np.ndarray:
+    """Close the corner rings and build an array of polygons from them."""
+    return shapely.polygons(np.concatenate([corners, corners[:, :1]], axis=1))
+
+
+def _rectangle_corners(rectangles: Sequence[Polygon]) -> np.ndarray:
+    """Extract the ``(N, 4, 2)`` corner array of closed four-cornered rectangles, dropping the closing vertex."""
+    geometries = np.empty(len(rectangles), dtype=object)
+    geometries[:] = list(rectangles)
+    return shapely.get_coordinates(geometries).reshape(-1, 5, 2)[:, :4]
+
+
+def _segmentize(points: np.ndarray, max_segment_length: float) -> np.ndarray:
+    """Insert evenly spaced vertices so no segment of ``points`` is longer than ``max_segment_length``.
+
+    Each segment of length ``L`` is split into ``ceil(L / max_segment_length)`` equal pieces, matching GEOS
+    ``segmentize`` without building a geometry.
+    """
+    segments = points[1:] - points[:-1]
+    lengths = norm(segments)
+    counts = np.maximum(1, np.ceil(lengths / max_segment_length).astype(np.int64))
+    segment_index = np.repeat(np.arange(counts.shape[0]), counts)
+    piece = np.arange(segment_index.shape[0]) - np.repeat(np.cumsum(counts) - counts, counts)
+    # Same arithmetic as GEOS so the inserted vertices are bit-identical to ``segmentize``.
+    segment_lengths = lengths[segment_index]
+    safe_lengths = np.where(segment_lengths == 0.0, 1.0, segment_lengths)
+    fractions = piece * (segment_lengths / counts[segment_index]) / safe_lengths
+    resampled = points[segment_index] + segments[segment_index] * fractions[:, None]
+    return np.concatenate([resampled, points[-1:]])
 
 
 def remove_narrow_areas(
@@ -120,40 +232,78 @@ def remove_narrow_areas(
     if len(polyline) < 2:
         return list(polyline), set()
 
-    removed: set[int] = set()
-    updated: list[Point] = list(polyline)
-
-    for index in range(len(polyline) - 1):
-        start = polyline[index]
-        end = polyline[index + 1]
-        segment = subtract(end, start)
-        length = norm(segment)
-        if length == 0.0:
-            continue
-        direction = unit_vector(segment)
-        normal = rotate90_cw(direction) if interior_is_right else rotate90_ccw(direction)
-        extension = min(overlap, length * 0.5)
-        a = subtract(start, scale(direction, extension))
-        b = add(end, scale(direction, extension))
-        inner_a = add(a, scale(normal, thickness))
-        inner_b = add(b, scale(normal, thickness))
-
-        if not polygon.covers(ShapelyPoint(*inner_b)):
-            removed.add(index + 1)
-        if not polygon.covers(ShapelyPoint(*inner_a)):
-            removed.add(index)
-
+    points = np.asarray(polyline, dtype=np.float64).reshape(-1, 2)
+    removed_mask = _narrow_vertex_mask(points, polygon, thickness, overlap, interior_is_right=interior_is_right)
+    removed: set[int] = set(np.flatnonzero(removed_mask).tolist())
     if not removed:
-        return updated, removed
+        return list(polyline), removed
 
-    updated = [point for idx, point in enumerate(polyline) if idx not in removed]
+    # Select the surviving vertices straight from the mask; the index set is only built for the return value.
+    updated = list(itertools.compress(polyline, (~removed_mask).tolist()))
     return updated, removed
 
 
+def _prune_narrow_vertices(
+    points: np.ndarray,
+    thickness: float,
+    overlap: float,
+    *,
+    interior_is_right: bool,
+) -> np.ndarray:
+    """Repeatedly drop narrow vertices from a ring until none are flagged.
+
+    Removing vertices replaces them with chords that can cut across the outline, so the polygon is rebuilt and
+    rescanned after every round. Each round flags all narrow vertices with one vectorized test.
+    """
+    while points.shape[0] > 4:
+        removed = _narrow_vertex_mask(points, Polygon(points), thickness, overlap, interior_is_right=interior_is_right)
+        if not removed.any():
+            break
+        # Rotating by one vertex moves the seam of the ring, so the next round tests its neighbourhood afresh.
+        points = np.roll(points[~removed], 1, axis=0)
+    return points
+
+
+def _narrow_vertex_mask(
+    points: np.ndarray,
+    polygon: Polygon,
+    thickness: float,
+    overlap: float,
+    *,
+    interior_is_right: bool,
+) -> np.ndarray:
+    """Flag the vertices of ``points`` whose neighbouring inner rectangle corners fall outside ``polygon``."""
+    shapely.prepare(polygon)
+    segments = subtract(points[1:], points[:-1])
+    lengths = norm(segments)
+    indices = np.flatnonzero(lengths != 0.0)
+    segments = segments[indices]
+    lengths = lengths[indices]
+
+    direction = unit_vector(segments)
+    normal = rotate90_cw(direction) if interior_is_right else rotate90_ccw(direction)
+    extension = np.minimum(overlap, lengths * 0.5)
+    a = subtract(points[indices], scale(direction, extension))
+    b = add(points[indices + 1], scale(direction, extension))
+    inner_a = add(a, scale(normal, thickness))
+    inner_b = add(b, scale(normal, thickness))
+
+    # Test every inner corner in a single vectorized predicate call straight from the coordinates. For a point,
+    # intersecting the polygon is the same as being covered by it, and no Point geometries need to be allocated.
+    corners = np.concatenate([inner_b, inner_a])
+    covered = shapely.intersects_xy(polygon, corners[:, 0], corners[:, 1])
+    covered_b, covered_a = covered[: indices.shape[0]], covered[indices.shape[0] :]
+    removed = np.zeros(points.shape[0], dtype=bool)
+    removed[indices[~covered_b] + 1] = True
+    removed[indices[~covered_a]] = True
+    return removed
+
+
 def extend_rectangles(
     glyph_polygon: Polygon,
     rectangles: Sequence[Polygon],
     extension: float,
+    simplify_tolerance: float = 0.0,
 ) -> list[Polygon]:
     """Extend rectangles forward and backward while staying inside the glyph.
 
@@ -165,20 +315,108 @@ def extend_rectangles(
         Rectangles to extend.
     extension : float
         Additional distance to extend in both tangential directions.
+    simplify_tolerance : float, optional
+        When positive, containment is tested against ``glyph_polygon`` simplified with this tolerance, which is much
+        cheaper for densely sampled outlines. Accepted extensions may then overshoot the glyph by up to the
+        tolerance, so callers should clip the final geometry. By default ``0.0`` (test against the exact glyph).
 
     Returns
     -------
     list of Polygon
         Extended rectangles.
     """
-    extended: list[Polygon] = []
-    for rectangle in rectangles:
-        forward = extend_forward(rectangle, extension)
-        candidate = forward if glyph_polygon.covers(forward) else rectangle
-        backward = extend_backward(candidate, extension)
-        candidate = backward if glyph_polygon.covers(backward) else candidate
-        extended.append(candidate)
-    return extended
+    if not rectangles:
+        return []
+    corners = extend_rectangle_corners(
+        glyph_polygon,
+        _rectangle_corners(rectangles),
+        extension,
+        simplify_tolerance=simplify_tolerance,
+    )
+    return corners_to_rectangles(corners)
+
+
+def extend_rectangle_corners(
+    glyph_polygon: Polygon,
+    corners: np.ndarray,
+    extension: float,
+    simplify_tolerance: float = 0.0,
+) -> np.ndarray:
+    """Corner-array variant of :func:`extend_rectangles`.
+
+    Parameters
+    ----------
+    glyph_polygon : Polygon
+        Glyph geometry used to clip the rectangles.
+    corners : ndarray, shape (N, 4, 2)
+        Rectangle corners ordered ``(a, b, inner_b, inner_a)``.
+    extension : float
+        Additional distance to extend in both tangential directions.
+    simplify_tolerance : float, optional
+        See :func:`extend_rectangles`, by default ``0.0``.
+
+    Returns
+    -------
+    ndarray, shape (N, 4, 2)
+        Corners of the extended rectangles.
+    """
+    if not corners.shape[0]:
+        return corners
+
+    if simplify_tolerance > 0.0:
+        glyph_polygon = shapely.simplify(glyph_polygon, simplify_tolerance, preserve_topology=True)
+
+    glyph_bounds = np.asarray(glyph_polygon.bounds)
+    parts = shapely.get_parts(glyph_polygon)
+    if parts.shape[0] > 1:
+        # Multi-part glyphs are indexed per component so each candidate is only tested against the parts whose
+        # bounding boxes contain it. Components touch at most in points, so a rectangle covered by the glyph is
+        # always covered by a single component.
+        glyph: Polygon | shapely.STRtree = shapely.STRtree(parts)
+    else:
+        # Preparing builds the polygon's segment index once instead of on every covers() test below.
+        shapely.prepare(glyph_polygon)
+        glyph = glyph_polygon
+
+    a, b, inner_b, inner_a = corners[:, 0], corners[:, 1], corners[:, 2], corners[:, 3]
+    step = scale(unit_vector(subtract(b, a)), extension)
+
+    forward = np.stack([a, b + step, inner_b + step, inner_a], axis=1)
+    forward_ok = _covered_mask(glyph, glyph_bounds, forward)
+    # The backward extension starts from the forward result wherever that was accepted.
+    corners = np.where(forward_ok[:, None, None], forward, corners)
+    backward = corners.copy()
+    backward[:, 0] -= step
+    backward[:, 3] -= step
+    backward_ok = _covered_mask(glyph, glyph_bounds, backward)
+    return np.where(backward_ok[:, None, None], backward, corners)
+
+
+def _covered_mask(
+    glyph: Polygon | shapely.STRtree,
+    glyph_bounds: np.ndarray,
+    candidates: np.ndarray,
+) -> np.ndarray:
+    """Test which candidate corner sets the glyph covers, skipping those outside its bounding box.
+
+    ``glyph`` is either the prepared glyph polygon or a tree over its components. Only the candidates passing the
+    analytic bounding-box test are turned into shapely polygons.
+    """
+    inside = np.all(candidates.min(axis=1) >= glyph_bounds[:2], axis=1) & np.all(
+        candidates.max(axis=1) <= glyph_bounds[2:],
+        axis=1,
+    )
+    covered = np.zeros(candidates.shape[0], dtype=bool)
+    if not inside.any():
+        return covered
+    polygons = _corner_polygons(candidates[inside])
+    if isinstance(glyph, shapely.STRtree):
+        hits = np.zeros(polygons.shape[0], dtype=bool)
+        hits[glyph.query(polygons, predicate="covered_by")[0]] = True
+        covered[inside] = hits
+    else:
+        covered[inside] = shapely.covers(glyph, polygons)
+    return covered
 
 
 def extend_forward(rectangle: Polygon, extension: float) -> Polygon:
@@ -197,11 +435,14 @@ def extend_forward(rectangle: Polygon, extension: float) -> Polygon:
     Polygon
         Extended rectangle.
     """
-    a, b, inner_b, inner_a, _ = list(rectangle.exterior.coords)
-    direction = unit_vector(subtract(b, a))
-    new_b = add(b, scale(direction, extension))
-    new_inner_b = add(inner_b, scale(direction, extension))
-    coords = [a, new_b, new_inner_b, inner_a, a]
+    (ax, ay), (bx, by), (inner_bx, inner_by), (inner_ax, inner_ay) = shapely.get_coordinates(rectangle)[:4].tolist()
+    dx = bx - ax
+    dy = by - ay
+    length = math.hypot(dx, dy)
+    ratio = extension / length if length else 0.0
+    step_x, step_y = dx * ratio, dy * ratio
+    new_b = (bx + step_x, by + step_y)
+    coords = [(ax, ay), new_b, (inner_bx + step_x, inner_by + step_y), (inner_ax, inner_ay), (ax, ay)]
     return Polygon(coords)
 
 
@@ -220,18 +461,25 @@ def extend_backward(rectangle: Polygon, extension: float) -> Polygon:
     Polygon
         Extended rectangle.
     """
-    a, b, inner_b, inner_a, _ = list(rectangle.exterior.coords)
-    direction = unit_vector(subtract(a, b))
-    new_a = add(a, scale(direction, extension))
-    new_inner_a = add(inner_a, scale(direction, extension))
-    coords = [new_a, b, inner_b, new_inner_a, new_a]
+    (ax, ay), (bx, by), (inner_bx, inner_by), (inner_ax, inner_ay) = shapely.get_coordinates(rectangle)[:4].tolist()
+    dx = ax - bx
+    dy = ay - by
+    length = math.hypot(dx, dy)
+    ratio = extension / length if length else 0.0
+    step_x, step_y = dx * ratio, dy * ratio
+    new_a = (ax + step_x, ay + step_y)
+    coords = [new_a, (bx, by), (inner_bx, inner_by), (inner_ax + step_x, inner_ay + step_y), new_a]
     return Polygon(coords)
 
 
 __all__ = [
+    "corners_to_rectangles",
     "extend_backward",
     "extend_forward",
+    "extend_rectangle_corners",
     "extend_rectangles",
+    "rectangle_corners_along_polylines",
     "rectangles_along_polyline",
+    "rectangles_along_polylines",
     "remove_narrow_areas",
 ]
@@ -0,0 +1,114 @@
+"""Polyline simplification helpers for flattened glyph contours."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from .geometry import Point
+
+# Ranges spanning fewer vertices than this are scanned in plain Python, where the fixed cost of the NumPy calls
+# outweighs the vectorized distance computation.
+_VECTORIZED_RDP_MIN_POINTS = 32
+
+
+def rdp_simplify(points: Sequence[Point] | np.ndarray, epsilon: float) -> np.ndarray:
+    """Simplify a polyline with the Ramer–Douglas–Peucker algorithm.
+
+    Parameters
+    ----------
+    points : sequence of Point or ndarray, shape (N, 2)
+        Ordered polyline vertices. Closed rings whose first and last vertices coincide are supported.
+    epsilon : float
+        Maximum allowed distance between the simplified polyline and the dropped vertices. Non-positive values
+        disable simplification.
+
+    Returns
+    -------
+    ndarray, shape (M, 2)
+        Retained vertices in their original order. The first and last vertices are always kept.
+    """
+    vertices = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    return vertices[rdp_mask(vertices, epsilon)]
+
+
+def rdp_mask(points: np.ndarray, epsilon: float) -> np.ndarray:
+    """Mark the vertices retained by Ramer–Douglas–Peucker simplification.
+
+    Parameters
+    ----------
+    points : ndarray, shape (N, 2)
+        Ordered float64 polyline vertices.
+    epsilon : float
+        Simplification tolerance, see :func:`rdp_simplify`.
+
+    Returns
+    -------
+    ndarray of bool, shape (N,)
+        ``True`` for every vertex that is kept.
+    """
+    count = points.shape[0]
+    keep = np.ones(count, dtype=bool)
+    if count < 3 or epsilon <= 0.0:
+        return keep
+
+    # Iterate over an explicit stack of index ranges instead of recursing. Each range either drops all of its
+    # interior vertices or splits at the farthest one. Distances are compared squared so no square roots are taken.
+    epsilon_sq = epsilon * epsilon
+    vertices = points.tolist()
+    stack = [(0, count - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+
+        if last - first < _VECTORIZED_RDP_MIN_POINTS:
+            farthest, farthest_sq = _farthest_vertex(vertices, first, last)
+        else:
+            start = points[first]
+            chord = points[last] - start
+            offsets = points[first + 1 : last] - start
+            chord_length_sq = float(chord[0] * chord[0] + chord[1] * chord[1])
+            if chord_length_sq == 0.0:
+                # Closed ring: the chord degenerates to a point, so measure the distance to it instead.
+                distances_sq = np.einsum("ij,ij->i", offsets, offsets)
+            else:
+                cross = chord[0] * offsets[:, 1] - chord[1] * offsets[:, 0]
+                distances_sq = cross * cross / chord_length_sq
+            index = int(np.argmax(distances_sq))
+            farthest, farthest_sq = first + 1 + index, float(distances_sq[index])
+
+        if farthest_sq > epsilon_sq:
+            stack.append((first, farthest))
+            stack.append((farthest, last))
+        else:
+            keep[first + 1 : last] = False
+
+    return keep
+
+
+def _farthest_vertex(vertices: list[list[float]], first: int, last: int) -> tuple[int, float]:
+    """Scan a short range in plain Python for the vertex farthest from its chord and its squared distance."""
+    start_x, start_y = vertices[first]
+    chord_x = vertices[last][0] - start_x
+    chord_y = vertices[last][1] - start_y
+    chord_length_sq = chord_x * chord_x + chord_y * chord_y
+    farthest = first + 1
+    farthest_sq = -1.0
+    for index in range(first + 1, last):
+        offset_x = vertices[index][0] - start_x
+        offset_y = vertices[index][1] - start_y
+        if chord_length_sq == 0.0:
+            distance_sq = offset_x * offset_x + offset_y * offset_y
+        else:
+            cross = chord_x * offset_y - chord_y * offset_x
+            distance_sq = cross * cross / chord_length_sq
+        if distance_sq > farthest_sq:
+            farthest, farthest_sq = index, distance_sq
+    return farthest, farthest_sq
+
+
+__all__ = ["rdp_mask", "rdp_simplify"]
@@ -7,6 +7,20 @@ import pytest
 from fontTools.ttLib import TTFont
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--strict-geometry",
+        action="store_true",
+        default=False,
+        help="Compare glyph polygons with exact overlays instead of simplified Hausdorff distances.",
+    )
+
+
+@pytest.fixture(scope="session")
+def strict_geometry(request: pytest.FixtureRequest) -> bool:
+    return bool(request.config.getoption("--strict-geometry"))
+
+
 @pytest.fixture(scope="session")
 def project_root() -> Path:
     return Path(__file__).resolve().parent.parent
@@ -1,8 +1,20 @@
 from __future__ import annotations
 
+import dataclasses
+import gc
 import math
 
-from parser.contours import FTContour, freetype_outline_to_contours
+import numpy as np
+import pytest
+from fontTools.ttLib import TTFont
+
+from parser.contours import (
+    _FONTTOOLS_LOOKUP,
+    FTContour,
+    fonttools_outline_to_contours,
+    freetype_outline_to_contours,
+    freetype_outlines_to_contours_batch,
+)
 
 
 def test_freetype_outline_to_contours_scaling(font_face) -> None:
@@ -33,3 +45,45 @@ def test_freetype_outline_to_contours_returns_ordered_points(font_face) -> None:
         dy = nxt[1] - current[1]
         distances.append(math.hypot(dx, dy))
     assert all(distance >= 0.0 for distance in distances)
+
+
+def test_freetype_outlines_to_contours_batch_matches_single_calls(font_face) -> None:
+    batch = freetype_outlines_to_contours_batch(font_face, ["B", "o"], 96)
+    for char, (contours, flags) in zip(["B", "o"], batch):
+        single_contours, single_flags = freetype_outline_to_contours(font_face, char, 96)
+        assert flags == single_flags
+        assert len(contours) == len(single_contours)
+        for contour, single in zip(contours, single_contours):
+            assert (contour.points == single.points).all()
+            assert contour.on_curve == single.on_curve
+
+
+def test_freetype_outline_to_contours_caches_immutable_results(font_face) -> None:
+    first, _ = freetype_outline_to_contours(font_face, "B", 80)
+    second, _ = freetype_outline_to_contours(font_face, "B", 80)
+
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second))
+    assert not first[0].points.flags.writeable
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first[0].on_curve = ()
+
+
+def test_ftcontour_compares_and_hashes_by_value() -> None:
+    first = FTContour(points=np.array([(0.0, 0.0), (1.0, 2.0)]), on_curve=(True, False))
+    second = FTContour(points=np.array([(0.0, 0.0), (1.0, 2.0)]), on_curve=(True, False))
+    assert first == second
+    assert hash(first) == hash(second)
+    assert len({first, second}) == 1
+    assert first != FTContour(points=np.array([(0.0, 0.0), (1.0, 3.0)]), on_curve=(True, False))
+    assert first != FTContour(points=np.array([(0.0, 0.0), (1.0, 2.0)]), on_curve=(True, True))
+
+
+def test_fonttools_lookup_is_evicted_with_its_font(font_path) -> None:
+    font = TTFont(str(font_path), lazy=True)
+    fonttools_outline_to_contours(font, "B", 96)
+    owner_id = id(font)
+    assert owner_id in _FONTTOOLS_LOOKUP
+    del font
+    gc.collect()
+    assert owner_id not in _FONTTOOLS_LOOKUP
@@ -38,6 +38,12 @@ def test_intersect_spans_combines_overlaps() -> None:
     assert overlaps == [(1.0, 3.0), (4.0, 5.0), (6.0, 7.0)]
 
 
+def test_intersect_spans_handles_empty_and_disjoint_inputs() -> None:
+    assert intersect_spans([], [(0.0, 1.0)]) == []
+    assert intersect_spans([(0.0, 1.0)], []) == []
+    assert intersect_spans([(0.0, 1.0), (4.0, 5.0)], [(2.0, 3.0), (6.0, 7.0)]) == []
+
+
 def test_intersect_spans_respects_tolerance() -> None:
     almost_touching = intersect_spans([(0.0, 1.0)], [(1.0 - 5e-13, 2.0)], tolerance=1e-12)
     assert almost_touching == []
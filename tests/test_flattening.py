@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
+
+from parser import flattening
 from parser.contours import FTContour
-from parser.flattening import flatten_contour
+from parser.flattening import flatten_contour, flatten_contours, flatten_contours_to_arrays
 
 
 def _has_point(points, target, *, tol=1e-9):
-    return any(abs(point[0] - target[0]) <= tol and abs(point[1] - target[1]) <= tol for point in points)
+    return bool(np.any(np.all(np.abs(np.asarray(points) - target) <= tol, axis=1)))
 
 
 def test_flatten_contour_with_line_segments() -> None:
@@ -18,6 +21,14 @@ def test_flatten_contour_with_line_segments() -> None:
     assert len(result) > 5
 
 
+def test_flatten_contour_splits_lines_into_exact_multiples() -> None:
+    contour = FTContour(points=[(0.0, 0.0), (3.0, 0.0)], on_curve=[True, True])
+    result = flatten_contour(contour, tags=[1, 1], min_segment_length=0.5)
+    # Each 3-unit edge is an exact multiple of the sampling distance and splits into six equal pieces.
+    assert len(result) == 13
+    assert _has_point(result, (0.5, 0.0))
+
+
 def test_flatten_contour_with_quadratics_and_midpoints() -> None:
     contour = FTContour(points=[(0.0, 0.0), (1.0, 2.0), (2.0, 0.0), (3.0, 2.0)], on_curve=[True, False, False, True])
     tags = [1, 0, 0, 1]
@@ -36,7 +47,10 @@ def test_flatten_contour_with_implicit_anchor() -> None:
 
 
 def test_flatten_contour_with_cubic_segments() -> None:
-    contour = FTContour(points=[(0.0, 0.0), (1.0, 1.5), (2.0, 0.0), (3.0, 1.5), (4.0, 0.0)], on_curve=[True, False, False, False, True])
+    contour = FTContour(
+        points=[(0.0, 0.0), (1.0, 1.5), (2.0, 0.0), (3.0, 1.5), (4.0, 0.0)],
+        on_curve=[True, False, False, False, True],
+    )
     tags = [1, 2, 2, 2, 1]
     result = flatten_contour(contour, tags, min_segment_length=0.4)
     assert result[0] == result[-1] == (0.0, 0.0)
@@ -67,6 +81,20 @@ def test_flatten_contour_handles_empty_input() -> None:
     assert flatten_contour(contour, tags=[], min_segment_length=1.0) == []
 
 
+def test_flatten_contours_matches_single_contour_calls() -> None:
+    contours = [
+        FTContour(points=[(0.0, 0.0), (1.0, 2.0), (2.0, 0.0), (3.0, 2.0)], on_curve=[True, False, False, True]),
+        FTContour(points=[], on_curve=[]),
+        FTContour(
+            points=[(0.0, 0.0), (1.0, 1.5), (2.0, 0.0), (3.0, 1.5), (4.0, 0.0)],
+            on_curve=[True, False, False, False, True],
+        ),
+    ]
+    tags = [[1, 0, 0, 1], [], [1, 2, 2, 2, 1]]
+    batched = flatten_contours(contours, tags, min_segment_length=0.5)
+    assert batched == [flatten_contour(contour, contour_tags, 0.5) for contour, contour_tags in zip(contours, tags)]
+
+
 def test_min_segment_length_controls_sampling_density() -> None:
     contour = FTContour(points=[(0.0, 0.0), (3.0, 0.0)], on_curve=[True, True])
     dense = flatten_contour(contour, tags=[1, 1], min_segment_length=0.5)
@@ -76,4 +104,43 @@ def test_min_segment_length_controls_sampling_density() -> None:
     assert sparse[0] == sparse[-1] == (0.0, 0.0)
     assert _has_point(dense, (3.0, 0.0))
     assert _has_point(sparse, (3.0, 0.0))
-    assert math.isclose(sum(point[0] for point in dense), sum(point[0] for point in reversed(dense)))
+    # The out-and-back contour retraces itself, so its x coordinates read the same in both directions.
+    dense_x = np.asarray(dense)[:, 0]
+    assert np.allclose(dense_x, dense_x[::-1])
+
+
+def test_flatten_contour_memoises_identical_contours() -> None:
+    contour = FTContour(points=[(0.0, 0.0), (1.0, 2.0), (2.0, 0.0), (3.0, 2.0)], on_curve=[True, False, False, True])
+    first = flatten_contour(contour, [1, 0, 0, 1], 0.5)
+    hits = flattening._flatten_contour_cached.cache_info().hits
+    second = flatten_contour(contour, (1, 0, 0, 1), 0.5)
+    assert flattening._flatten_contour_cached.cache_info().hits == hits + 1
+    assert second == first
+    second.append((9.0, 9.0))
+    assert flatten_contour(contour, [1, 0, 0, 1], 0.5) == first
+
+
+def test_flatten_contours_to_arrays_matches_tuple_polylines() -> None:
+    contours = [
+        FTContour(points=[(0.0, 0.0), (1.0, 2.0), (2.0, 0.0), (3.0, 2.0)], on_curve=[True, False, False, True]),
+        FTContour(points=[], on_curve=[]),
+    ]
+    tags = [[1, 0, 0, 1], []]
+    arrays = flatten_contours_to_arrays(contours, tags, min_segment_length=0.25)
+    polylines = flatten_contours(contours, tags, min_segment_length=0.25)
+    assert [array.shape[1] for array in arrays] == [2, 2]
+    assert [list(map(tuple, array.tolist())) for array in arrays] == polylines
+
+
+def test_flatten_contour_long_quadratic_contour_matches_state_machine(monkeypatch) -> None:
+    angles = [2.0 * math.pi * index / 60 for index in range(60)]
+    points = [(10.0 * math.cos(angle), 10.0 * math.sin(angle)) for angle in angles]
+    on_curve = [index % 3 == 0 for index in range(60)]
+    tags = [1 if flag else 0 for flag in on_curve]
+    contour = FTContour(points=points, on_curve=on_curve)
+
+    result = flatten_contour(contour, tags=tags, min_segment_length=0.5)
+    monkeypatch.setattr(flattening, "_VECTORIZED_CLASSIFY_MIN_POINTS", len(points))
+    reference = flatten_contour(contour, tags=tags, min_segment_length=0.5)
+    assert result == reference
+    assert result[0] == result[-1] == points[0]
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
+
 from parser.geometry import (
     add,
     norm,
     polygon_is_ccw,
+    polygon_signed_area,
     rotate90_ccw,
     rotate90_cw,
     scale,
@@ -45,3 +48,29 @@ def test_rotations_and_orientation() -> None:
     # A rotated unit vector should retain unit length.
     rotated = rotate90_ccw(unit_vector((1.0, 0.0)))
     assert math.isclose(norm(rotated), 1.0)
+
+
+def test_polygon_is_ccw_accepts_arrays() -> None:
+    ccw_square = np.array([(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)])
+    assert polygon_is_ccw(ccw_square)
+    assert not polygon_is_ccw(ccw_square[::-1])
+    assert not polygon_is_ccw(ccw_square[:2])
+
+
+def test_vector_helpers_accept_arrays() -> None:
+    vectors = np.array([[3.0, 4.0], [0.0, 0.0], [0.0, -2.0]])
+    np.testing.assert_allclose(add(vectors, (1.0, 1.0)), vectors + 1.0)
+    np.testing.assert_allclose(subtract(vectors, vectors), np.zeros_like(vectors))
+    np.testing.assert_allclose(scale(vectors, np.array([2.0, 1.0, 0.5])), [[6.0, 8.0], [0.0, 0.0], [0.0, -1.0]])
+    np.testing.assert_allclose(norm(vectors), [5.0, 0.0, 2.0])
+    np.testing.assert_allclose(unit_vector(vectors), [[0.6, 0.8], [0.0, 0.0], [0.0, -1.0]])
+    np.testing.assert_allclose(rotate90_ccw(vectors), [[-4.0, 3.0], [0.0, 0.0], [2.0, 0.0]])
+    np.testing.assert_allclose(rotate90_cw(vectors), [[4.0, -3.0], [0.0, 0.0], [-2.0, 0.0]])
+
+
+def test_polygon_signed_area() -> None:
+    ccw_square = [(0.0, 0.0), (2.0, 0.0), (2.0, 2.0), (0.0, 2.0)]
+    assert polygon_signed_area(ccw_square) == 4.0
+    assert polygon_signed_area(list(reversed(ccw_square))) == -4.0
+    assert polygon_signed_area(np.array([*ccw_square, ccw_square[0]])) == 4.0
+    assert polygon_signed_area([(0.0, 0.0), (1.0, 1.0)]) == 0.0
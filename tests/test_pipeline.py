@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import os
+import shutil
 from typing import Any
 
+import numpy as np
 import pytest
+import shapely
 from shapely.geometry import MultiPolygon, Polygon
 
 from parser.glyph import GlyphOutline
@@ -21,7 +25,23 @@ def _square(x0: float, y0: float, size: float) -> Polygon:
     )
 
 
-def test_build_rectangles_for_glyph_combines_geometry(monkeypatch: pytest.MonkeyPatch) -> None:
+def _corners(rectangle: Polygon) -> np.ndarray:
+    return shapely.get_coordinates(rectangle)[None, :4]
+
+
+@pytest.fixture()
+def fresh_glyph_geometry():
+    # The faked outlines below must not leak into, or be shadowed by, the process-wide glyph cache.
+    pipeline._glyph_geometry.cache_clear()
+    yield
+    pipeline._glyph_geometry.cache_clear()
+
+
+def test_build_rectangles_for_glyph_combines_geometry(
+    monkeypatch: pytest.MonkeyPatch,
+    font_path,
+    fresh_glyph_geometry,
+) -> None:
     outline = GlyphOutline(
         exteriors=[[(0.0, 0.0), (5.0, 0.0), (5.0, 5.0), (0.0, 5.0), (0.0, 0.0)]],
         holes=[],
@@ -38,29 +58,32 @@ def test_build_rectangles_for_glyph_combines_geometry(monkeypatch: pytest.Monkey
         assert arg is outline
         return glyph_polygon
 
-    def fake_rectangles_along_polyline(polyline, *args: Any, **kwargs: Any):
-        assert polyline == outline.exteriors[0]
-        return [boundary_rectangle]
+    def fake_rectangle_corners_along_polylines(polylines, *args: Any, **kwargs: Any) -> np.ndarray:
+        if polylines is outline.holes:
+            assert kwargs["remove_narrow"] is False
+            return np.empty((0, 4, 2))
+        assert polylines is outline.exteriors
+        return _corners(boundary_rectangle)
 
-    def fake_extend_rectangles(glyph_poly, rectangles, extension):
-        assert glyph_poly == glyph_polygon
-        assert rectangles == [boundary_rectangle]
+    def fake_extend_rectangle_corners(glyph_poly, corners, extension):
+        assert glyph_poly is glyph_polygon
+        assert np.array_equal(corners, _corners(boundary_rectangle))
         assert extension == pytest.approx(2.0)
-        return rectangles
+        return corners
 
     def fake_fill_polygon_with_rectangles(**kwargs: Any):
-        assert kwargs["glyph_polygon"] == glyph_polygon
+        assert kwargs["glyph_polygon"] is glyph_polygon
         assert kwargs["existing_geometry"].covers(boundary_rectangle)
         return [interior_rectangle]
 
     monkeypatch.setattr(pipeline, "get_glyph_outline", fake_get_glyph_outline)
     monkeypatch.setattr(pipeline, "outline_to_polygon", fake_outline_to_polygon)
-    monkeypatch.setattr(pipeline, "rectangles_along_polyline", fake_rectangles_along_polyline)
-    monkeypatch.setattr(pipeline, "extend_rectangles", fake_extend_rectangles)
+    monkeypatch.setattr(pipeline, "rectangle_corners_along_polylines", fake_rectangle_corners_along_polylines)
+    monkeypatch.setattr(pipeline, "extend_rectangle_corners", fake_extend_rectangle_corners)
     monkeypatch.setattr(pipeline, "fill_polygon_with_rectangles", fake_fill_polygon_with_rectangles)
 
     combined, rectangles = pipeline.build_rectangles_for_glyph(
-        face=None,
+        str(font_path),
         char="A",
         pixel_height=32,
         thickness=2.0,
@@ -73,7 +96,11 @@ def test_build_rectangles_for_glyph_combines_geometry(monkeypatch: pytest.Monkey
     assert pytest.approx(combined.area) == expected_area
 
 
-def test_build_rectangles_for_glyph_handles_multipolygons(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_build_rectangles_for_glyph_handles_multipolygons(
+    monkeypatch: pytest.MonkeyPatch,
+    font_path,
+    fresh_glyph_geometry,
+) -> None:
     outline = GlyphOutline(
         exteriors=[[(0.0, 0.0), (3.0, 0.0), (3.0, 3.0), (0.0, 3.0)]],
         holes=[],
@@ -88,23 +115,24 @@ def test_build_rectangles_for_glyph_handles_multipolygons(monkeypatch: pytest.Mo
     def fake_outline_to_polygon(arg: GlyphOutline):
         return glyph_polygon
 
-    def fake_rectangles_along_polyline(polyline, *args: Any, **kwargs: Any):
-        return [boundary_rectangle]
+    def fake_rectangle_corners_along_polylines(polylines, *args: Any, **kwargs: Any) -> np.ndarray:
+        assert kwargs["interior_is_right"] is True
+        return _corners(boundary_rectangle) if polylines else np.empty((0, 4, 2))
 
-    def fake_extend_rectangles(glyph_poly, rectangles, extension):
-        return rectangles
+    def fake_extend_rectangle_corners(glyph_poly, corners, extension):
+        return corners
 
     def fake_fill_polygon_with_rectangles(**kwargs: Any):
         return []
 
     monkeypatch.setattr(pipeline, "get_glyph_outline", fake_get_glyph_outline)
     monkeypatch.setattr(pipeline, "outline_to_polygon", fake_outline_to_polygon)
-    monkeypatch.setattr(pipeline, "rectangles_along_polyline", fake_rectangles_along_polyline)
-    monkeypatch.setattr(pipeline, "extend_rectangles", fake_extend_rectangles)
+    monkeypatch.setattr(pipeline, "rectangle_corners_along_polylines", fake_rectangle_corners_along_polylines)
+    monkeypatch.setattr(pipeline, "extend_rectangle_corners", fake_extend_rectangle_corners)
     monkeypatch.setattr(pipeline, "fill_polygon_with_rectangles", fake_fill_polygon_with_rectangles)
 
     combined, rectangles = pipeline.build_rectangles_for_glyph(
-        face=None,
+        str(font_path),
         char="B",
         pixel_height=64,
         thickness=1.0,
@@ -116,7 +144,11 @@ def test_build_rectangles_for_glyph_handles_multipolygons(monkeypatch: pytest.Mo
     assert combined.intersects(_square(0.0, 0.0, 1.0))
 
 
-def test_build_rectangles_for_glyph_returns_polygon_when_empty(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_build_rectangles_for_glyph_returns_polygon_when_empty(
+    monkeypatch: pytest.MonkeyPatch,
+    font_path,
+    fresh_glyph_geometry,
+) -> None:
     outline = GlyphOutline(
         exteriors=[[(0.0, 0.0), (2.0, 0.0), (2.0, 2.0)]],
         holes=[],
@@ -130,23 +162,23 @@ def test_build_rectangles_for_glyph_returns_polygon_when_empty(monkeypatch: pyte
     def fake_outline_to_polygon(arg: GlyphOutline):
         return glyph_polygon
 
-    def fake_rectangles_along_polyline(*args: Any, **kwargs: Any):
-        return []
+    def fake_rectangle_corners_along_polylines(*args: Any, **kwargs: Any) -> np.ndarray:
+        return np.empty((0, 4, 2))
 
-    def fake_extend_rectangles(*args: Any, **kwargs: Any):
-        return []
+    def fake_extend_rectangle_corners(glyph_poly, corners, extension):
+        return corners
 
     def fail_fill(**kwargs: Any):
         raise AssertionError("fill_polygon_with_rectangles should not be called when boundary is empty")
 
     monkeypatch.setattr(pipeline, "get_glyph_outline", fake_get_glyph_outline)
     monkeypatch.setattr(pipeline, "outline_to_polygon", fake_outline_to_polygon)
-    monkeypatch.setattr(pipeline, "rectangles_along_polyline", fake_rectangles_along_polyline)
-    monkeypatch.setattr(pipeline, "extend_rectangles", fake_extend_rectangles)
+    monkeypatch.setattr(pipeline, "rectangle_corners_along_polylines", fake_rectangle_corners_along_polylines)
+    monkeypatch.setattr(pipeline, "extend_rectangle_corners", fake_extend_rectangle_corners)
     monkeypatch.setattr(pipeline, "fill_polygon_with_rectangles", fail_fill)
 
     combined, rectangles = pipeline.build_rectangles_for_glyph(
-        face=None,
+        str(font_path),
         char="C",
         pixel_height=64,
         thickness=2.0,
@@ -154,4 +186,75 @@ def test_build_rectangles_for_glyph_returns_polygon_when_empty(monkeypatch: pyte
     )
 
     assert rectangles == []
-    assert combined.equals(glyph_polygon)
\ No newline at end of file
+    assert combined.equals(glyph_polygon)
+
+
+def test_build_rectangles_for_glyphs_matches_single_glyph_calls(font_path) -> None:
+    kwargs = {"pixel_height": 96, "thickness": 6.0, "overlap": 0.0, "min_segment_length": 2.0}
+    batch = pipeline.build_rectangles_for_glyphs(str(font_path), ["B", "o"], max_workers=2, **kwargs)
+    for char, (combined, rectangles) in zip(["B", "o"], batch):
+        single_combined, single_rectangles = pipeline.build_rectangles_for_glyph(str(font_path), char, **kwargs)
+        assert combined.equals(single_combined)
+        assert len(rectangles) == len(single_rectangles)
+
+
+def test_build_rectangles_for_glyphs_processes_repeated_chars_once(font_path) -> None:
+    kwargs = {"pixel_height": 96, "thickness": 6.0, "overlap": 0.0, "min_segment_length": 2.0}
+    batch = pipeline.build_rectangles_for_glyphs(str(font_path), ["o", "B", "o"], max_workers=2, **kwargs)
+    assert len(batch) == 3
+    assert batch[0] is batch[2]
+    assert batch[0][0].equals(pipeline.build_rectangles_for_glyph(str(font_path), "o", **kwargs)[0])
+
+
+def test_build_rectangles_for_string_matches_single_glyph_calls(font_path) -> None:
+    kwargs = {"pixel_height": 96, "thickness": 6.0, "overlap": 0.0, "min_segment_length": 2.0}
+    results = pipeline.build_rectangles_for_string(str(font_path), "Bo", max_workers=2, **kwargs)
+    assert len(results) == 2
+    for char, (combined, rectangles) in zip("Bo", results):
+        single_combined, single_rectangles = pipeline.build_rectangles_for_glyph(str(font_path), char, **kwargs)
+        assert combined.equals(single_combined)
+        assert all(first.equals_exact(second, 0.0) for first, second in zip(rectangles, single_rectangles))
+        assert len(rectangles) == len(single_rectangles)
+
+
+def test_build_rectangles_for_glyph_reuses_glyph_geometry(font_path) -> None:
+    kwargs = {"pixel_height": 80, "thickness": 6.0, "overlap": 0.0, "min_segment_length": 2.0}
+    first, _ = pipeline.build_rectangles_for_glyph(str(font_path), "D", **kwargs)
+    hits = pipeline._glyph_geometry.cache_info().hits
+    second, _ = pipeline.build_rectangles_for_glyph(str(font_path), "D", **kwargs)
+    assert pipeline._glyph_geometry.cache_info().hits == hits + 1
+    assert first.equals(second)
+
+    mtime = font_path.stat().st_mtime_ns
+    _, glyph_polygon = pipeline._glyph_geometry(str(font_path), mtime, "D", 80, 2.0, 0.0, "fonttools")
+    assert shapely.is_prepared(glyph_polygon)
+
+
+def test_build_rectangles_for_glyph_reloads_replaced_font(font_path, tmp_path) -> None:
+    font = tmp_path / font_path.name
+    shutil.copyfile(font_path, font)
+    kwargs = {"pixel_height": 80, "thickness": 6.0, "overlap": 0.0, "min_segment_length": 2.0}
+    pipeline.build_rectangles_for_glyph(str(font), "D", **kwargs)
+    misses = pipeline._glyph_geometry.cache_info().misses
+    stat = font.stat()
+    os.utime(font, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    pipeline.build_rectangles_for_glyph(str(font), "D", **kwargs)
+    assert pipeline._glyph_geometry.cache_info().misses == misses + 1
+
+
+def test_build_rectangles_for_glyph_keeps_rectangles_inside_thin_glyphs(project_root) -> None:
+    font_file = project_root / "fonts" / "OldStandardTT-Regular.ttf"
+    font = str(font_file)
+    _, rectangles = pipeline.build_rectangles_for_glyph(
+        font,
+        "S",
+        pixel_height=96,
+        thickness=6.0,
+        overlap=2.0,
+        min_segment_length=1.0,
+    )
+    assert rectangles
+    # The unclipped rectangles are turned into beams directly, so they must not leak past the outline.
+    _, outline_polygon = pipeline._glyph_geometry(font, font_file.stat().st_mtime_ns, "S", 96, 1.0, 0.0, "fonttools")
+    leaked = shapely.difference(shapely.union_all(rectangles), outline_polygon).area
+    assert leaked < 0.01 * outline_polygon.area
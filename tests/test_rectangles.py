@@ -1,12 +1,17 @@
 from __future__ import annotations
 
-from shapely.geometry import Polygon
+import numpy as np
+from shapely.geometry import MultiPolygon, Polygon
 
 from parser.rectangles import (
+    corners_to_rectangles,
     extend_backward,
     extend_forward,
+    extend_rectangle_corners,
     extend_rectangles,
+    rectangle_corners_along_polylines,
     rectangles_along_polyline,
+    rectangles_along_polylines,
     remove_narrow_areas,
 )
 
@@ -80,3 +85,52 @@ def test_extend_rectangles_clips_to_glyph() -> None:
 
     for rectangle in extended:
         assert glyph_polygon.covers(rectangle)
+
+
+def test_extend_rectangles_handles_multipart_glyphs() -> None:
+    left = Polygon([(-2.0, -1.0), (6.0, -1.0), (6.0, 2.0), (-2.0, 2.0)])
+    right = Polygon([(10.0, -1.0), (14.0, -1.0), (14.0, 2.0), (10.0, 2.0)])
+    glyph_polygon = MultiPolygon([left, right])
+    rectangles = [build_rectangle(), Polygon([(11.0, 0.0), (13.0, 0.0), (13.0, 1.0), (11.0, 1.0), (11.0, 0.0)])]
+
+    extended = extend_rectangles(glyph_polygon, rectangles, 1.0)
+    assert extended[0].equals(extend_rectangles(left, rectangles[:1], 1.0)[0])
+    assert extended[1].equals(extend_rectangles(right, rectangles[1:], 1.0)[0])
+    assert all(glyph_polygon.covers(rectangle) for rectangle in extended)
+
+
+def test_extend_rectangles_with_simplified_glyph_stays_within_tolerance() -> None:
+    angles = np.linspace(0.0, 2.0 * np.pi, 400, endpoint=False)
+    glyph_polygon = Polygon(np.column_stack([20.0 * np.cos(angles), 20.0 * np.sin(angles)]))
+    rectangles = [Polygon([(-2.0, -1.0), (2.0, -1.0), (2.0, 1.0), (-2.0, 1.0), (-2.0, -1.0)])]
+
+    exact = extend_rectangles(glyph_polygon, rectangles, 1.0)
+    simplified = extend_rectangles(glyph_polygon, rectangles, 1.0, simplify_tolerance=0.5)
+    assert simplified[0].equals(exact[0])
+    assert glyph_polygon.buffer(0.5).covers(simplified[0])
+
+
+def test_rectangles_along_polylines_matches_single_polyline_calls() -> None:
+    square = [(0.0, 0.0), (4.0, 0.0), (4.0, 3.0), (0.0, 3.0), (0.0, 0.0)]
+    triangle = [(10.0, 0.0), (16.0, 0.0), (13.0, 5.0), (10.0, 0.0)]
+    batch = rectangles_along_polylines([square, [(0.0, 0.0)], triangle], 0.5, 0.2, interior_is_right=False)
+    single = [
+        *rectangles_along_polyline(square, 0.5, 0.2, interior_is_right=False),
+        *rectangles_along_polyline(triangle, 0.5, 0.2, interior_is_right=False),
+    ]
+    assert len(batch) == len(single)
+    assert all(first.equals_exact(second, 1e-12) for first, second in zip(batch, single))
+
+
+def test_corner_arrays_match_polygon_api() -> None:
+    glyph_polygon = Polygon([(0.0, 0.0), (8.0, 0.0), (8.0, 6.0), (0.0, 6.0)])
+    ring = [(1.0, 1.0), (7.0, 1.0), (7.0, 5.0), (1.0, 5.0), (1.0, 1.0)]
+
+    corners = rectangle_corners_along_polylines([ring], 0.5, 0.0, interior_is_right=False)
+    assert corners.shape[1:] == (4, 2)
+    rectangles = rectangles_along_polylines([ring], 0.5, 0.0, interior_is_right=False)
+    assert all(a.equals_exact(b, 0.0) for a, b in zip(corners_to_rectangles(corners), rectangles))
+
+    extended = corners_to_rectangles(extend_rectangle_corners(glyph_polygon, corners, 0.5))
+    expected = extend_rectangles(glyph_polygon, rectangles, 0.5)
+    assert all(a.equals_exact(b, 0.0) for a, b in zip(extended, expected))
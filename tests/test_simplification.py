@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from parser import simplification
+from parser.simplification import rdp_mask, rdp_simplify
+
+if TYPE_CHECKING:
+    import pytest
+
+
+def test_rdp_simplify_removes_collinear_points() -> None:
+    polyline = [(float(x), 0.0) for x in range(11)]
+    result = rdp_simplify(polyline, 0.1)
+    assert result.tolist() == [[0.0, 0.0], [10.0, 0.0]]
+
+
+def test_rdp_simplify_keeps_corners_of_closed_ring() -> None:
+    ring = [(0.0, 0.0), (1.0, 0.0), (2.0, 0.0), (2.0, 1.0), (2.0, 2.0), (1.0, 2.0), (0.0, 2.0), (0.0, 1.0), (0.0, 0.0)]
+    result = rdp_simplify(ring, 0.1)
+    assert result.tolist() == [[0.0, 0.0], [2.0, 0.0], [2.0, 2.0], [0.0, 2.0], [0.0, 0.0]]
+
+
+def test_rdp_simplify_respects_epsilon() -> None:
+    polyline = np.array([(0.0, 0.0), (1.0, 0.05), (2.0, 0.5), (3.0, 0.0)])
+    assert rdp_simplify(polyline, 0.0).shape == (4, 2)
+    assert rdp_simplify(polyline, 0.2).tolist() == [[0.0, 0.0], [2.0, 0.5], [3.0, 0.0]]
+    assert rdp_simplify(polyline, 1.0).tolist() == [[0.0, 0.0], [3.0, 0.0]]
+
+
+def test_rdp_mask_marks_retained_vertices() -> None:
+    polyline = np.array([(0.0, 0.0), (1.0, 0.05), (2.0, 0.5), (3.0, 0.0)])
+    assert rdp_mask(polyline, 0.2).tolist() == [True, False, True, True]
+    assert rdp_mask(polyline[:2], 0.2).tolist() == [True, True]
+
+
+def test_rdp_mask_scalar_ranges_match_vectorized(monkeypatch: pytest.MonkeyPatch) -> None:
+    rng = np.random.default_rng(7)
+    polyline = np.cumsum(rng.normal(size=(200, 2)), axis=0)
+    ring = np.vstack([polyline, polyline[:1]])
+
+    for points in (polyline, ring):
+        monkeypatch.setattr(simplification, "_VECTORIZED_RDP_MIN_POINTS", 2)
+        vectorized = rdp_mask(points, 1.5)
+        monkeypatch.setattr(simplification, "_VECTORIZED_RDP_MIN_POINTS", len(points) + 1)
+        scalar = rdp_mask(points, 1.5)
+        assert np.array_equal(vectorized, scalar)